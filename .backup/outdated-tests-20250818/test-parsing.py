@@ -1,52 +1,59 @@
 #!/usr/bin/env python3
 import re
 
-# Test the parsing logic
-content = open('/Users/jeffaxelrod/Documents/Sightline/test-gumloop-output.md').read()
+# Fenced ```markdown block, compiled once
+_FENCED_MARKDOWN_RE = re.compile(rb'```markdown(.*?)```', re.DOTALL)
+
+# Test the parsing logic (bytes throughout; text is only decoded for printing)
+with open('/Users/jeffaxelrod/Documents/Sightline/test-gumloop-output.md', 'rb') as f:
+    content = f.read()
 
 # Extract markdown content
-markdownContent = content
-markdownStart = content.find('```markdown')
-if markdownStart != -1:
-    start = markdownStart + len('```markdown')
-    markdownEnd = content.find('```', start)
-    if markdownEnd != -1:
-        markdownContent = content[start:markdownEnd]
-
-# Find all headers
-sectionRegex = r'^#{2,3}\s+(.+)$'
-matches = list(re.finditer(sectionRegex, markdownContent, re.MULTILINE))
+fenced = _FENCED_MARKDOWN_RE.search(content)
+markdownContent = fenced.group(1) if fenced else content
+markdownView = memoryview(markdownContent)
 
-print("Found headers:")
-for match in matches:
-    print(f"  - {match.group(1)} at position {match.start()}")
+def decoded(view):
+    return view.tobytes().strip().decode('utf-8')
 
-# Test extracting specific sections
+# Headers and --- delimiters in one line scan: a section runs from its
+# header line to whichever of the next header or delimiter comes first.
+# Sections are kept as zero-copy memoryview slices.
+headers = []
 sections = {}
-for i in range(len(matches)):
-    match = matches[i]
-    sectionName = match.group(1).strip().lower()
-    startIndex = match.end()
+openSection = None
+offset = 0
+for line in markdownContent.split(b'\n'):
+    lineEnd = offset + len(line)
     
-    # Find end
-    endIndex = len(markdownContent)
+    # "## " / "### " headers only; "####" and deeper are body text
+    level = len(line) - len(line.lstrip(b'#'))
+    title = line[level:].strip() if level in (2, 3) and line[level:level + 1].isspace() else b''
+    isDelimiter = offset > 0 and line.startswith(b'---')
     
-    # Check for --- delimiter
-    delimiterIndex = markdownContent.find('\n---', startIndex)
-    if delimiterIndex != -1 and delimiterIndex < endIndex:
-        endIndex = delimiterIndex
+    if (title or isDelimiter) and openSection is not None:
+        sectionName, startIndex = openSection
+        sections[sectionName] = markdownView[startIndex:offset]
+        openSection = None
     
-    # Check for next header
-    if i + 1 < len(matches):
-        nextHeaderIndex = matches[i + 1].start()
-        if nextHeaderIndex < endIndex:
-            endIndex = nextHeaderIndex
+    if title:
+        title = title.decode('utf-8')
+        headers.append((offset, level, title))
+        openSection = (title.lower(), lineEnd)
     
-    sectionContent = markdownContent[startIndex:endIndex].strip()
-    sections[sectionName] = sectionContent
+    offset = lineEnd + 1
+
+if openSection is not None:
+    sectionName, startIndex = openSection
+    sections[sectionName] = markdownView[startIndex:]
+
+print("Found headers:")
+for position, level, title in headers:
+    print(f"  - H{level} {title} at byte offset {position}")
 
 print("\nExtracted sections:")
-for name, content in sections.items():
+for name, view in sections.items():
+    content = decoded(view)
     print(f"\n[{name}]")
     print(content[:100] + "..." if len(content) > 100 else content)
     
@@ -56,8 +63,8 @@ print(f"Feynman Flashcards: {'feynman flashcards' in sections}")
 
 if 'playbooks & heuristics' in sections:
     print("\nPlaybooks content:")
-    print(sections['playbooks & heuristics'])
+    print(decoded(sections['playbooks & heuristics']))
     
 if 'feynman flashcards' in sections:
     print("\nFlashcards content:")
-    print(sections['feynman flashcards'])
\ No newline at end of file
+    print(decoded(sections['feynman flashcards']))
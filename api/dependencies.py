@@ -1,8 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from typing import Optional
+from typing import Optional, Tuple
+from functools import lru_cache
 import os
+import time
 from datetime import datetime
 
 security = HTTPBearer()
@@ -10,6 +12,7 @@ security = HTTPBearer()
 # JWT configuration
 SECRET_KEY = os.getenv("NEXTAUTH_SECRET", "development-secret")
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
 
 class User:
     def __init__(self, id: str, email: str, role: str = "USER"):
@@ -17,6 +20,16 @@ class User:
         self.email = email
         self.role = role
 
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Tuple[Optional[str], Optional[str], str, Optional[float]]:
+    """Decode and verify a JWT once; repeat requests with the same token hit the cache.
+    
+    Invalid tokens raise JWTError and are never cached. Callers must still
+    check the returned expiry, since a cached token can expire later.
+    """
+    payload = jwt.decode(token, SECRET_KEY, algorithms=_ALGORITHMS)
+    return payload.get("id"), payload.get("email"), payload.get("role", "USER"), payload.get("exp")
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
@@ -24,10 +37,11 @@ async def get_current_user(
     token = credentials.credentials
     
     try:
-        # Decode JWT token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("id")
-        email: str = payload.get("email")
+        # Decode JWT token (cached per token)
+        user_id, email, role, exp = _decode_token(token)
+        
+        if exp is not None and exp <= time.time():
+            raise JWTError("Signature has expired.")
         
         if user_id is None or email is None:
             raise HTTPException(
@@ -36,7 +50,7 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
             
-        return User(id=user_id, email=email, role=payload.get("role", "USER"))
+        return User(id=user_id, email=email, role=role)
         
     except JWTError:
         raise HTTPException(
@@ -5,20 +5,46 @@ This script gets the public IP address of the server making YouTube API calls
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import socket
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+def _lookup_ipify(session):
+    """ipify.org (most reliable)"""
+    response = session.get('https://api.ipify.org?format=json', timeout=5)
+    return response.json()['ip']
+
+def _lookup_ifconfig(session):
+    """ifconfig.me (backup)"""
+    response = session.get('https://ifconfig.me/ip', timeout=5)
+    return response.text.strip()
+
+def _lookup_ipinfo(session):
+    """ipinfo.io (with location info)"""
+    response = session.get('https://ipinfo.io/json', timeout=5)
+    return response.json()
+
 def get_server_ip():
     """Get the public IP address of this server"""
     
     print("🔍 Detecting Server IP Address...")
     print("=" * 50)
     
+    # Query all three services concurrently so wall time is the slowest
+    # lookup rather than the sum; results are still read in priority order.
+    # One pooled session keeps connections alive for retries.
+    with requests.Session() as session:
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ipify = executor.submit(_lookup_ipify, session)
+            ifconfig = executor.submit(_lookup_ifconfig, session)
+            ipinfo = executor.submit(_lookup_ipinfo, session)
+    
     # Method 1: Using ipify.org (most reliable)
     try:
-        response = requests.get('https://api.ipify.org?format=json', timeout=5)
-        ip = response.json()['ip']
+        ip = ipify.result()
         print(f"✅ Public IP (via ipify): {ip}")
         public_ip = ip
     except Exception as e:
@@ -27,8 +53,7 @@ def get_server_ip():
     
     # Method 2: Using ifconfig.me (backup)
     try:
-        response = requests.get('https://ifconfig.me/ip', timeout=5)
-        ip = response.text.strip()
+        ip = ifconfig.result()
         print(f"✅ Public IP (via ifconfig): {ip}")
         if not public_ip:
             public_ip = ip
@@ -37,8 +62,7 @@ def get_server_ip():
     
     # Method 3: Using ipinfo.io (with location info)
     try:
-        response = requests.get('https://ipinfo.io/json', timeout=5)
-        data = response.json()
+        data = ipinfo.result()
         print(f"✅ Public IP (via ipinfo): {data.get('ip')}")
         print(f"   Location: {data.get('city')}, {data.get('region')}, {data.get('country')}")
         print(f"   ISP: {data.get('org')}")
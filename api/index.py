@@ -1,30 +1,119 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+import asyncio
+import orjson
 import os
-import json
+import re
+import zlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Prefer uvloop for every loop created after import (e.g. the serverless
+# wrapper); uvicorn's own loop is chosen with --loop uvloop at startup
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Add current directory to Python path for imports
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
 
+# Deployment flags, resolved once at import
+from utils.environment import is_development
+_IS_DEV = is_development()
+_IS_PROD = bool(os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("PRODUCTION"))
+_ON_RAILWAY = bool(os.getenv("RAILWAY_ENVIRONMENT"))
+
 # Setup structured logging
 from logging_config import setup_logging, get_logger
-setup_logging(level="INFO")
+setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = get_logger(__name__)
 
+# Import progress storage service
+from services.progress_storage import progress_storage, STATUS_QUEUED, STAGE_QUEUED
+
+def _detect_public_ip() -> str:
+    """Look up this server's public IP (blocking; run in a thread)"""
+    import requests
+    return requests.get('https://api.ipify.org?format=json', timeout=5).json()['ip']
+
+async def _log_public_ip():
+    """Log server IP address for API key restriction"""
+    try:
+        public_ip = await asyncio.to_thread(_detect_public_ip)
+        logger.info("Server public IP (use for YouTube API key restrictions in Google Cloud Console)",
+                    public_ip=public_ip)
+    except Exception as e:
+        logger.warning("Could not detect public IP", error=str(e))
+
+# How often expired progress records are purged while the server runs
+PROGRESS_CLEANUP_INTERVAL = int(os.getenv("PROGRESS_CLEANUP_INTERVAL", "300"))
+
+async def _cleanup_expired_progress():
+    """Delete expired progress records, logging how many were removed"""
+    try:
+        deleted_count = await progress_storage.cleanup_expired()
+    except Exception as e:
+        logger.warning("Progress cleanup failed", error=str(e))
+        return
+    if deleted_count > 0:
+        logger.info("Cleaned up expired progress records", deleted=deleted_count)
+
+async def _cleanup_loop():
+    """Purge expired progress records every PROGRESS_CLEANUP_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(PROGRESS_CLEANUP_INTERVAL)
+        await _cleanup_expired_progress()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize progress storage on startup; close connections on shutdown."""
+    # The IP lookup is independent of the database, so run both concurrently
+    await asyncio.gather(progress_storage.init(), _log_public_ip())
+    
+    # Run cleanup on startup, then periodically for the life of the server
+    await _cleanup_expired_progress()
+    cleanup_task = asyncio.create_task(_cleanup_loop())
+    
+    yield
+    
+    cleanup_task.cancel()
+    await asyncio.gather(cleanup_task, return_exceptions=True)
+    await progress_storage.close()
+    await monitoring.close()
+    
+    try:
+        from services.youtube_service import close_youtube_service
+    except ImportError:
+        return
+    await close_youtube_service()
+
 # Create FastAPI app
 app = FastAPI(
     title="Sightline API",
     description="AI-powered YouTube video summarization API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress large JSON bodies (summaries run tens of KB). Added first so it sits
+# innermost, next to the endpoints; CORS stays outermost. Starlette skips
+# text/event-stream.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Import and setup enhanced monitoring
-from monitoring import setup_monitoring
+from monitoring import monitoring, setup_monitoring
 setup_monitoring(app)
 
 # Import correlation middleware
@@ -34,51 +123,79 @@ from middleware.correlation import CorrelationMiddleware
 app.add_middleware(CorrelationMiddleware)
 
 # Configure CORS with more flexible configuration
-allowed_origins = [
-    "http://localhost:3000",
-    "https://sightlineai.io",
-    "https://www.sightlineai.io",
-    "https://sightline.ai",  # Keep for any old references
-    "https://www.sightline.ai",
-]
+@lru_cache(maxsize=1)
+def _build_origins() -> tuple:
+    """Allowed origins, assembled from the environment once"""
+    origins = [
+        "http://localhost:3000",
+        "https://sightlineai.io",
+        "https://www.sightlineai.io",
+        "https://sightline.ai",  # Keep for any old references
+        "https://www.sightline.ai",
+    ]
+
+    # Add production URL from environment if available
+    app_url = os.getenv("NEXT_PUBLIC_APP_URL")
+    if app_url:
+        origins.append(app_url)
 
-# Add production URL from environment if available
-if os.getenv("NEXT_PUBLIC_APP_URL"):
-    allowed_origins.append(os.getenv("NEXT_PUBLIC_APP_URL"))
+    # Add custom allowed origins from environment (comma-separated)
+    custom_origins = os.getenv("ALLOWED_ORIGINS")
+    if custom_origins:
+        origins.extend(origin.strip() for origin in custom_origins.split(",") if origin.strip())
 
-# Add custom allowed origins from environment (comma-separated)
-if os.getenv("ALLOWED_ORIGINS"):
-    custom_origins = os.getenv("ALLOWED_ORIGINS").split(",")
-    allowed_origins.extend([origin.strip() for origin in custom_origins])
+    # In production, also allow Vercel preview deployments
+    if _IS_PROD:
+        # This will allow all Vercel preview URLs
+        origins.append("https://*.vercel.app")
+        origins.append("https://sightline-ai-*.vercel.app")
 
-# In production, also allow Vercel preview deployments
-if os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("PRODUCTION"):
-    # This will allow all Vercel preview URLs
-    allowed_origins.append("https://*.vercel.app")
-    allowed_origins.append("https://sightline-ai-*.vercel.app")
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(origins))
 
-# Remove duplicates while preserving order
-seen = set()
-allowed_origins = [x for x in allowed_origins if not (x in seen or seen.add(x))]
+allowed_origins = _build_origins()
 
-print(f"🔒 CORS allowed origins: {allowed_origins}")
+logger.info("CORS allowed origins", origins=allowed_origins)
+
+# Explicit methods/headers let Starlette answer preflights without wildcard handling;
+# headers cover auth, JSON bodies and the correlation headers read by CorrelationMiddleware
+_CORS_METHODS = ["GET", "POST", "DELETE", "OPTIONS"]
+_CORS_HEADERS = [
+    "authorization",
+    "content-type",
+    CorrelationMiddleware.CORRELATION_HEADER,
+    CorrelationMiddleware.REQUEST_ID_HEADER,
+    CorrelationMiddleware.TASK_ID_HEADER,
+    CorrelationMiddleware.USER_ID_HEADER,
+]
+
+# Production origins: any single-label Vercel deployment plus the fixed sites.
+# Compiled once with re.ASCII (Starlette reuses an already-compiled pattern);
+# [\w-]+ instead of .* keeps a crafted Origin from matching across dots.
+_PROD_ORIGIN_RE = re.compile(
+    r"https://[\w-]+\.vercel\.app\Z"
+    r"|https://(?:www\.)?sightlineai\.io\Z"
+    r"|https://(?:www\.)?sightline\.ai\Z"
+    r"|http://localhost:3000\Z",
+    re.ASCII,
+)
 
 # Use regex pattern in production to match all Vercel deployments
-if os.getenv("RAILWAY_ENVIRONMENT"):
+if _ON_RAILWAY:
     app.add_middleware(
         CORSMiddleware,
-        allow_origin_regex=r"https://.*\.vercel\.app$|https://sightlineai\.io|https://www\.sightlineai\.io|https://sightline\.ai|https://www\.sightline\.ai|http://localhost:3000",
+        allow_origin_regex=_PROD_ORIGIN_RE,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
     )
 else:
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allowed_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
     )
 
 # Health check endpoint
@@ -129,43 +246,53 @@ async def get_server_ip():
 async def root():
     return {"message": "Sightline API", "version": "0.1.0"}
 
-# Add current directory to Python path
-import sys
-import os
-sys.path.insert(0, os.path.dirname(__file__))
-
-# Import progress storage service
-from services.progress_storage import progress_storage
+# Clients poll progress several times a second; a short-lived in-process layer
+# absorbs repeat polls without a database roundtrip each time
+_progress_cache = TTLCache(maxsize=10_000, ttl=0.25)
 
 # Progress tracking endpoint - uses database storage
 @app.get("/api/progress/{task_id}")
-async def get_progress(task_id: str):
-    """Get progress for a task ID. Returns default values if task not found."""
-    progress = await progress_storage.get_progress(task_id)
+async def get_progress(task_id: str, request: Request):
+    """Get progress for a task ID. Returns default values if task not found.
     
+    Responses carry a weak ETag so polling clients get a bodiless 304 while
+    the progress, status and stage are unchanged.
+    """
+    progress = _progress_cache.get(task_id)
     if progress is None:
-        # Return "queued" state for unknown tasks
-        return {
-            "progress": 0, 
-            "stage": "Queued...", 
-            "status": "queued",
-            "task_id": task_id
-        }
+        progress = await progress_storage.get_progress(task_id)
+
+        if progress is None:
+            # Return "queued" state for unknown tasks
+            progress = {
+                "progress": 0,
+                "stage": STAGE_QUEUED,
+                "status": STATUS_QUEUED,
+                "task_id": task_id
+            }
+        _progress_cache[task_id] = progress
     
-    return progress
+    stage = str(progress.get("stage", "")).encode()
+    etag = f'W/"{progress.get("progress")}-{progress.get("status")}-{zlib.crc32(stage):08x}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse(progress, headers=headers)
 
 # Progress cleanup endpoint for completed tasks
 @app.delete("/api/progress/{task_id}")
-async def cleanup_progress(task_id: str):
-    """Clean up completed progress data."""
-    deleted = await progress_storage.delete_progress(task_id)
-    return {"status": "cleaned" if deleted else "not_found"}
+async def cleanup_progress(task_id: str, background_tasks: BackgroundTasks):
+    """Clean up completed progress data after the response has been sent."""
+    _progress_cache.pop(task_id, None)
+    background_tasks.add_task(progress_storage.delete_progress, task_id)
+    return Response(status_code=204)
 
 # Debug endpoint for development only
 @app.get("/api/progress/debug/{task_id}")
 async def debug_progress(task_id: str):
     """Get raw progress record with metadata (dev only)."""
-    if os.getenv("NODE_ENV") != "development" and os.getenv("ENVIRONMENT") != "development":
+    if not _IS_DEV:
         raise HTTPException(status_code=404, detail="Not found")
     
     debug_info = await progress_storage.get_debug_info(task_id)
@@ -174,415 +301,67 @@ async def debug_progress(task_id: str):
     
     return debug_info
 
-# Cleanup expired records periodically
-@app.on_event("startup")
-async def startup_event():
-    """Initialize progress storage and schedule cleanup."""
-    await progress_storage.init()
-    
-    # Log server IP address for API key restriction
-    try:
-        import requests
-        public_ip = requests.get('https://api.ipify.org?format=json', timeout=5).json()['ip']
-        print(f"🌐 Server Public IP: {public_ip}")
-        print(f"   Use this IP for YouTube API key restrictions in Google Cloud Console")
-        logger.info(f"Server Public IP: {public_ip}")
-    except Exception as e:
-        print(f"⚠️ Could not detect public IP: {str(e)}")
-        logger.warning(f"Could not detect public IP: {str(e)}")
-    
-    # Run cleanup on startup
-    deleted_count = await progress_storage.cleanup_expired()
-    if deleted_count > 0:
-        print(f"🧹 Cleaned up {deleted_count} expired progress records")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close database connections on shutdown."""
-    await progress_storage.close()
-
 # Import and include routers
 try:
     from routers import summarize, transcript, health
     app.include_router(health.router, prefix="/api")
     app.include_router(summarize.router, prefix="/api")
     app.include_router(transcript.router, prefix="/api")
-    print("✅ Routers imported successfully")
+    logger.info("Routers imported successfully")
 except ImportError as e:
-    print(f"❌ Could not import routers: {e}")
-    print("📝 Available files in routers/:")
-    routers_dir = os.path.join(os.path.dirname(__file__), 'routers')
-    if os.path.exists(routers_dir):
-        for file in os.listdir(routers_dir):
-            print(f"  - {file}")
+    logger.warning("Could not import routers, using fallback endpoints", error=str(e))
     
-    # Create working summarize endpoint as fallback
-    @app.post("/api/summarize")
-    async def working_summarize(request: Request):
-        import uuid
-        import asyncio
-        import re
-        from datetime import datetime
-        
-        # Extract correlation ID from request state (set by middleware)
-        from middleware.correlation import extract_correlation_id, extract_task_id
-        cid = extract_correlation_id(request)
-        
-        # Generate task ID immediately
-        task_id = str(uuid.uuid4())
-        
-        # Set task ID in logging context
-        from logging_config import set_correlation_context
-        set_correlation_context(task_id=task_id)
-        
-        try:
-            # Import required modules here to avoid import issues
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(__file__))
-            
-            from services.youtube_service import YouTubeService
-            from services.langchain_service import LangChainService
-            
-            # Get request body
-            body = await request.json()
-            
-            # Structured logging with correlation ID
-            logger.info("Starting summarization", 
-                       url=body.get("url"),
-                       task_id=task_id)
-            url = body.get("url", "")
-            if not url:
-                await progress_storage.set_progress(task_id, {"progress": 0, "stage": "Error: URL is required", "status": "error", "task_id": task_id, "cid": cid})
-                return {"error": "URL is required", "task_id": task_id, "cid": cid}
-            
-            # Initialize progress tracking immediately
-            await progress_storage.set_progress(task_id, {"progress": 5, "stage": "Initializing...", "status": "processing", "task_id": task_id, "cid": cid})
-            
-            # Extract video ID
-            patterns = [
-                r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})',
-                r'youtube\.com\/watch\?.*v=([a-zA-Z0-9_-]{11})'
-            ]
-            
-            video_id = None
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    video_id = match.group(1)
-                    break
-            
-            if not video_id:
-                await progress_storage.set_progress(task_id, {"progress": 0, "stage": "Error: Invalid YouTube URL", "status": "error", "task_id": task_id, "cid": cid})
-                return {"error": "Invalid YouTube URL", "task_id": task_id, "cid": cid}
-            
-            # Initialize services
-            await progress_storage.set_progress(task_id, {"progress": 10, "stage": "Connecting to YouTube...", "status": "processing", "task_id": task_id, "cid": cid})
-            await asyncio.sleep(0.1)  # Brief pause to ensure progress is visible
-            
-            youtube_service = YouTubeService()
-            langchain_service = LangChainService()
-            
-            # Get real video info and transcript
-            print(f"🔄 Processing video ID: {video_id}")
-            
-            # Update progress: Getting video info and transcript in parallel
-            await progress_storage.set_progress(task_id, {"progress": 25, "stage": "Fetching video data and transcript...", "status": "processing", "task_id": task_id, "cid": cid})
-            video_info, (transcript, is_gumloop) = await youtube_service.get_video_data_parallel(video_id)
-            print(f"📹 Video info: {video_info.title} by {video_info.channel_name} ({video_info.view_count} views)")
-            print(f"📝 Transcript source: {'Gumloop' if is_gumloop else 'Standard'}")
-            
-            if not transcript:
-                await progress_storage.set_progress(task_id, {"progress": 40, "stage": "Error: No transcript available", "status": "error", "task_id": task_id, "cid": cid})
-                return {"error": "Could not retrieve transcript for this video. The video may not have captions available.", "task_id": task_id}
-            
-            print(f"📝 Retrieved transcript ({len(transcript)} characters)")
-            
-            # Update progress: Analyzing content
-            await progress_storage.set_progress(task_id, {"progress": 60, "stage": "Analyzing content with AI...", "status": "processing", "task_id": task_id, "cid": cid})
-            await asyncio.sleep(0.1)
-            
-            # Update progress: Generating summary
-            await progress_storage.set_progress(task_id, {"progress": 80, "stage": "Generating your summary...", "status": "processing", "task_id": task_id, "cid": cid})
-            summary = await langchain_service.summarize_transcript(
-                transcript=transcript,
-                video_title=video_info.title,
-                channel_name=video_info.channel_name,
-                video_url=url
-            )
-            
-            # Update progress: Complete - this is critical for frontend coordination
-            await progress_storage.set_progress(task_id, {"progress": 100, "stage": "Summary ready!", "status": "completed", "task_id": task_id, "cid": cid})
-            print(f"✅ Progress marked as complete for task {task_id}")
-            
-            result = {
-                "video_id": video_id,
-                "video_url": url,
-                "video_title": video_info.title,
-                "channel_name": video_info.channel_name,
-                "channel_id": video_info.channel_id,
-                "duration": video_info.duration,
-                "thumbnail_url": video_info.thumbnail_url,
-                "summary": summary.content,
-                "key_points": summary.key_points,
-                "user_id": "test-user",
-                "task_id": task_id,
-                # Enhanced metadata from YouTubeMetadataService
-                "description": video_info.description,
-                "view_count": video_info.view_count,
-                "like_count": video_info.like_count,
-                "comment_count": video_info.comment_count,
-                "upload_date": video_info.upload_date.isoformat() if video_info.upload_date else None,
-                "is_gumloop": is_gumloop,
-                # Processing source metadata
-                "processing_source": "gumloop" if is_gumloop else "standard",
-                "processing_version": "v1.0",
-                "language": "en",
-                # === GUMLOOP RICH CONTENT ===
-                # Extract speakers from metadata or content
-                "speakers": getattr(summary.metadata, 'speakers', []) if summary.metadata else [],
-                "synopsis": getattr(summary.metadata, 'synopsis', None) if summary.metadata else None,
-                # Rich structured sections
-                "key_moments": [{"timestamp": km.timestamp, "insight": km.insight} for km in summary.key_moments],
-                "frameworks": [{"name": f.name, "description": f.description} for f in getattr(summary, 'frameworks', [])],
-                "debunked_assumptions": getattr(summary, 'debunked_assumptions', []),
-                "in_practice": getattr(summary, 'in_practice', []),
-                "playbooks": [{"trigger": p.trigger, "action": p.action} for p in getattr(summary, 'playbooks', [])],
-                # Learning pack
-                "learning_pack": {
-                    "flashcards": [{"q": card.question, "a": card.answer} for card in summary.flashcards],
-                    "quiz": [{"q": quiz.question, "a": quiz.answer} for quiz in summary.quiz_questions],
-                    "glossary": [{"term": card.q, "definition": card.a} for card in summary.knowledge_cards],
-                    "novel_ideas": []  # Will be populated from AI analysis
-                } if (summary.flashcards or summary.quiz_questions or summary.knowledge_cards) else None,
-                # Enrichment data
-                "enrichment": {
-                    "tools": getattr(summary, 'tools', []),
-                    "sentiment": getattr(summary.insight_enrichment, 'sentiment', 'neutral') if hasattr(summary, 'insight_enrichment') and summary.insight_enrichment else 'neutral',
-                    "risks": getattr(summary.insight_enrichment, 'risks_blockers_questions', []) if hasattr(summary, 'insight_enrichment') and summary.insight_enrichment else []
-                },
-                "metadata": {
-                    "task_id": task_id,
-                    "source": "gumloop" if is_gumloop else "standard",
-                    "ai_version": "v1.0"
-                }
-            }
-            
-            print(f"🎯 Returning result with task_id: {task_id}")
-            return result
-            
-        except Exception as e:
-            # Always update progress with error state
-            error_msg = f"Summarization failed: {str(e)}"
-            await progress_storage.set_progress(task_id, {"progress": 0, "stage": f"Error: {str(e)}", "status": "error", "task_id": task_id, "cid": cid})
-            print(f"❌ Error in summarization (task {task_id}): {error_msg}")
-            return {"error": error_msg, "task_id": task_id}
-    
-    # Create a test endpoint to debug
-    @app.post("/api/test-summarize")
-    async def test_summarize(request: dict):
-        try:
-            url = request.get("url", "")
-            return {
-                "status": "test_success",
-                "url": url,
-                "message": "Test endpoint working"
-            }
-        except Exception as e:
-            return {"error": str(e)}
-    
-    # Metadata refresh endpoint
-    @app.post("/api/refresh-metadata")
-    async def refresh_metadata(request: Request):
-        """Refresh YouTube metadata for an existing summary"""
-        try:
-            from datetime import datetime
-            
-            body = await request.json()
-            video_id = body.get("video_id")
-            
-            if not video_id:
-                raise HTTPException(status_code=400, detail="video_id is required")
-            
-            # Extract correlation ID
-            from middleware.correlation import extract_correlation_id
-            cid = extract_correlation_id(request)
-            
-            logger.info("Refreshing metadata", video_id=video_id, cid=cid)
-            
-            # Initialize metadata service
-            from services.youtube_metadata_service import YouTubeMetadataService
-            metadata_service = YouTubeMetadataService()
-            
-            # Fetch fresh metadata
-            metadata = await metadata_service.get_metadata(video_id)
-            
-            # Format response
-            result = {
-                "video_id": video_id,
-                "title": metadata.get('title'),
-                "description": metadata.get('description'),
-                "channel_name": metadata.get('channel_name'),
-                "view_count": metadata.get('view_count'),
-                "like_count": metadata.get('like_count'),
-                "comment_count": metadata.get('comment_count'),
-                "upload_date": metadata.get('upload_date').isoformat() if metadata.get('upload_date') else None,
-                "duration": metadata.get('duration'),
-                "thumbnail_url": metadata.get('thumbnail_url'),
-                "refreshed_at": datetime.now().isoformat(),
-                "cid": cid
-            }
-            
-            logger.info("Metadata refreshed successfully", 
-                       video_id=video_id, 
-                       view_count=result.get('view_count'),
-                       cid=cid)
-            
-            return result
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Failed to refresh metadata", error=str(e))
-            raise HTTPException(status_code=500, detail=f"Failed to refresh metadata: {str(e)}")
+    # Directory listing is a debugging aid only; skip the scan on normal cold starts
+    try:
+        from config import settings
+        _debug = settings.debug
+    except Exception:
+        _debug = False
+    if _debug:
+        routers_dir = os.path.join(os.path.dirname(__file__), 'routers')
+        if os.path.exists(routers_dir):
+            logger.debug("Available files in routers/", files=os.listdir(routers_dir))
     
-    # Development-only synthetic test endpoint (always enabled for local testing)
-    if True:  # Enable for testing - normally: os.getenv("NODE_ENV") == "development"
-        @app.post("/api/dev/synthetic")
-        async def synthetic_summary(request: Request):
-            """Synthetic test endpoint that triggers a fixed public video summary with correlation tracking"""
-            import uuid
-            import asyncio
-            from datetime import datetime
-            
-            # Generate correlation ID
-            cid = request.headers.get("x-correlation-id", str(uuid.uuid4()))
-            
-            # Fixed public test video (Rick Astley - Never Gonna Give You Up)
-            TEST_VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-            
-            # Generate task ID
-            task_id = str(uuid.uuid4())
-            
-            # Structured logging with correlation ID
-            print(json.dumps({
-                "timestamp": datetime.now().isoformat(),
-                "level": "INFO",
-                "component": "api.synthetic",
-                "cid": cid,
-                "task_id": task_id,
-                "message": "Starting synthetic summary test",
-                "video_url": TEST_VIDEO_URL
-            }))
-            
-            try:
-                # Initialize progress with correlation ID
-                await progress_storage.set_progress(task_id, {
-                    "progress": 5,
-                    "stage": "Synthetic test starting...",
-                    "status": "processing",
-                    "task_id": task_id,
-                    "cid": cid
-                })
-                
-                # Log progress update
-                print(json.dumps({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "component": "api.synthetic.progress",
-                    "cid": cid,
-                    "task_id": task_id,
-                    "progress": 5,
-                    "message": "Progress initialized"
-                }))
-                
-                # Simulate processing stages with delays
-                stages = [
-                    (25, "Fetching test video data..."),
-                    (50, "Processing synthetic transcript..."),
-                    (75, "Generating test summary..."),
-                    (100, "Synthetic test complete!")
-                ]
-                
-                for progress, stage in stages:
-                    await asyncio.sleep(0.5)  # Simulate processing time
-                    await progress_storage.set_progress(task_id, {
-                        "progress": progress,
-                        "stage": stage,
-                        "status": "completed" if progress == 100 else "processing",
-                        "task_id": task_id,
-                        "cid": cid
-                    })
-                    
-                    print(json.dumps({
-                        "timestamp": datetime.now().isoformat(),
-                        "level": "INFO",
-                        "component": "api.synthetic.progress",
-                        "cid": cid,
-                        "task_id": task_id,
-                        "progress": progress,
-                        "stage": stage,
-                        "message": f"Progress update: {stage}"
-                    }))
-                
-                # Return response with correlation ID
-                response = {
-                    "task_id": task_id,
-                    "cid": cid,
-                    "video_url": TEST_VIDEO_URL,
-                    "message": "Synthetic test initiated successfully",
-                    "poll_endpoint": f"/api/progress/{task_id}"
-                }
-                
-                print(json.dumps({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "component": "api.synthetic",
-                    "cid": cid,
-                    "task_id": task_id,
-                    "message": "Synthetic test completed",
-                    "response": response
-                }))
-                
-                return response
-                
-            except Exception as e:
-                error_msg = f"Synthetic test failed: {str(e)}"
-                await progress_storage.set_progress(task_id, {
-                    "progress": 0,
-                    "stage": f"Error: {str(e)}",
-                    "status": "error",
-                    "task_id": task_id,
-                    "cid": cid
-                })
-                
-                print(json.dumps({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "ERROR",
-                    "component": "api.synthetic",
-                    "cid": cid,
-                    "task_id": task_id,
-                    "error": str(e),
-                    "message": error_msg
-                }))
-                
-                return {"error": error_msg, "task_id": task_id, "cid": cid}
+    # Fallback summarize/test/metadata endpoints live in their own router
+    from routers import fallback
+    app.include_router(fallback.router, prefix="/api")
 
 # Error handlers
-@app.exception_handler(HTTPException)
+@lru_cache(maxsize=64)
+def _http_error_body(status_code: int, detail: str) -> bytes:
+    """Serialized error body, reused for repeated errors such as 404s"""
+    return orjson.dumps({"error": detail, "status_code": status_code})
+
+# Registered on Starlette's base class so routing 404s/405s, which never
+# raise FastAPI's subclass, get the same body
+@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request, exc):
-    return {
-        "error": exc.detail,
-        "status_code": exc.status_code
-    }
+    if isinstance(exc.detail, str):
+        return Response(
+            _http_error_body(exc.status_code, exc.detail),
+            status_code=exc.status_code,
+            headers=exc.headers,
+            media_type="application/json",
+        )
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error": exc.detail,
+            "status_code": exc.status_code
+        },
+        headers=exc.headers
+    )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    return {
-        "error": "Internal server error",
-        "detail": str(exc) if os.getenv("NODE_ENV") == "development" else None,
-        "status_code": 500
-    }
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal server error",
+            "detail": str(exc) if _IS_DEV else None,
+            "status_code": 500
+        }
+    )
 
 # Vercel handler
 handler = app
\ No newline at end of file
@@ -1,42 +1,92 @@
 """
 Structured logging configuration for FastAPI backend
+
+Records below the configured level are dropped before any record is built.
+Call sites that compute expensive fields can skip that work too with
+``if logger.logger.isEnabledFor(logging.DEBUG): logger.debug(...)``.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import sys
 import time
 from typing import Dict, Any, Optional
 from datetime import datetime
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
+
+def _json_default(obj: Any) -> str:
+    """Serialize values the JSON encoder has no native support for"""
+    if isinstance(obj, datetime):
+        return obj.isoformat().replace('+00:00', 'Z')
+    return str(obj)
+
+try:
+    # orjson serializes log entries several times faster than the stdlib; optional
+    import orjson
+
+    # Non-str keys (status-code maps, UUIDs) are stringified like json.dumps
+    # does instead of raising and dropping the record
+    _ORJSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS).decode()
 
-# Context variables for correlation tracking
-correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
-request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
-task_id_var: ContextVar[Optional[str]] = ContextVar('task_id', default=None)
-user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS | orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default, indent=2)
+
+# Correlation IDs for the current context, keyed by their log entry field
+# (correlationId, requestId, taskId, userId). One variable means one set/get
+# per request; the dict is replaced on update, never mutated, so records can
+# keep a reference to it.
+correlation_context_var: ContextVar[Dict[str, str]] = ContextVar('correlation_context', default={})
+
+def _record_context(record: logging.LogRecord) -> Dict[str, str]:
+    """Correlation IDs captured when the record was queued"""
+    context = getattr(record, 'correlation_context', None)
+    if context is None:
+        context = correlation_context_var.get()
+    return context
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
+    # (epoch second, formatted UTC prefix) of the last record; most records
+    # share a second with the one before, so only the microseconds change
+    _cached_second = (-1, "")
+    
+    def __init__(self, include_location: bool = False):
+        super().__init__()
+        self._include_location = include_location
+    
+    @classmethod
+    def _timestamp(cls, created: float) -> str:
+        sec = int(created)
+        cached_sec, prefix = cls._cached_second
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            cls._cached_second = (sec, prefix)
+        return f"{prefix}.{min(round((created - sec) * 1e6), 999999):06d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         # Base log entry
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'component': record.name,
             'message': record.getMessage(),
         }
         
         # Add correlation IDs from context
-        if cid := correlation_id_var.get():
-            log_entry['correlationId'] = cid
-        if rid := request_id_var.get():
-            log_entry['requestId'] = rid
-        if tid := task_id_var.get():
-            log_entry['taskId'] = tid
-        if uid := user_id_var.get():
-            log_entry['userId'] = uid
+        log_entry.update(_record_context(record))
         
         # Add any extra fields from the record
         if hasattr(record, 'extra_fields'):
@@ -51,15 +101,15 @@ class StructuredFormatter(logging.Formatter):
             if record.exc_text:
                 log_entry['error']['stack'] = record.exc_text
         
-        # Add location information in development
-        if logging.getLogger().level == logging.DEBUG:
+        # Add location information when logging at DEBUG level
+        if self._include_location:
             log_entry['location'] = {
                 'file': record.pathname,
                 'line': record.lineno,
                 'function': record.funcName,
             }
         
-        return json.dumps(log_entry)
+        return _dumps(log_entry)
 
 class DevelopmentFormatter(logging.Formatter):
     """Human-readable formatter for development"""
@@ -81,24 +131,38 @@ class DevelopmentFormatter(logging.Formatter):
         'CRITICAL': '💀',
     }
     
+    # Color and emoji per level, joined once (both tables list levels in the same order)
+    _LEVEL_PREFIX = {level: color + emoji for (level, color), emoji in zip(COLORS.items(), EMOJIS.values())}
+    
+    # (epoch second, formatted local time) of the last record
+    _cached_second = (-1, "")
+    
+    @classmethod
+    def _timestamp(cls, created: float) -> str:
+        sec = int(created)
+        cached_sec, prefix = cls._cached_second
+        if sec != cached_sec:
+            prefix = time.strftime("%H:%M:%S", time.localtime(sec))
+            cls._cached_second = (sec, prefix)
+        return f"{prefix}.{int((created - sec) * 1e3):03d}"
+    
     def format(self, record: logging.LogRecord) -> str:
         # Get correlation ID for display
-        cid = correlation_id_var.get()
+        cid = _record_context(record).get('correlationId')
         cid_str = f" [{cid}]" if cid else ""
         
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S.%f')[:-3]
+        timestamp = self._timestamp(record.created)
         
         # Get color and emoji
-        level_color = self.COLORS.get(record.levelname, '')
-        emoji = self.EMOJIS.get(record.levelname, '')
+        prefix = self._LEVEL_PREFIX.get(record.levelname, '')
         
         # Build formatted message
-        formatted = f"{level_color}{emoji} [{timestamp}] [{record.name}]{cid_str} {record.getMessage()}{self.RESET}"
+        formatted = f"{prefix} [{timestamp}] [{record.name}]{cid_str} {record.getMessage()}{self.RESET}"
         
         # Add metadata if present
         if hasattr(record, 'extra_fields'):
-            formatted += f"\n    {json.dumps(record.extra_fields, indent=2)}"
+            formatted += f"\n    {_dumps_indented(record.extra_fields)}"
         
         # Add exception info if present
         if record.exc_info:
@@ -113,51 +177,92 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.name = name
     
-    def _log(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None, exc_info=None):
-        """Internal logging method with structured fields"""
-        # Create a LogRecord with extra fields
-        record = self.logger.makeRecord(
-            self.logger.name,
-            level,
-            "(unknown file)",
-            0,
-            message,
-            (),
-            exc_info,
-        )
+    def _log(self, level: int, message: str, args: tuple = (), extra: Optional[Dict[str, Any]] = None, exc_info=None):
+        """Internal logging method with structured fields.
+
+        %-style args are merged into the message only when the record is
+        formatted, so filtered records never build the string.
+        """
+        # Skip building the record entirely when the level is filtered out
+        if not self.logger.isEnabledFor(level):
+            return
         
-        # Add extra fields to record
+        # Extra fields, plus stage information if present, become record attributes
+        record_extra = None
         if extra:
-            record.extra_fields = extra
+            record_extra = {'extra_fields': extra}
+            if 'stage' in extra:
+                record_extra['stage'] = extra['stage']
+            if 'progress' in extra:
+                record_extra['progress'] = extra['progress']
         
-        # Add stage information if present
-        if extra and 'stage' in extra:
-            record.stage = extra['stage']
-        if extra and 'progress' in extra:
-            record.progress = extra['progress']
-        
-        self.logger.handle(record)
+        # stacklevel skips this method and the public wrapper, so records carry
+        # the caller's file and line
+        self.logger.log(level, message, *args, exc_info=exc_info, extra=record_extra, stacklevel=3)
     
-    def debug(self, message: str, **kwargs):
-        self._log(logging.DEBUG, message, kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        # Debug calls are the most common and usually disabled in production
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, args, kwargs)
     
-    def info(self, message: str, **kwargs):
-        self._log(logging.INFO, message, kwargs)
+    def info(self, message: str, *args, **kwargs):
+        self._log(logging.INFO, message, args, kwargs)
     
-    def warning(self, message: str, **kwargs):
-        self._log(logging.WARNING, message, kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        self._log(logging.WARNING, message, args, kwargs)
     
-    def error(self, message: str, error: Optional[Exception] = None, **kwargs):
+    def error(self, message: str, *args, error: Optional[Exception] = None, **kwargs):
         exc_info = (type(error), error, error.__traceback__) if error else None
-        self._log(logging.ERROR, message, kwargs, exc_info=exc_info)
+        self._log(logging.ERROR, message, args, kwargs, exc_info=exc_info)
     
-    def critical(self, message: str, error: Optional[Exception] = None, **kwargs):
+    def critical(self, message: str, *args, error: Optional[Exception] = None, **kwargs):
         exc_info = (type(error), error, error.__traceback__) if error else None
-        self._log(logging.CRITICAL, message, kwargs, exc_info=exc_info)
+        self._log(logging.CRITICAL, message, args, kwargs, exc_info=exc_info)
     
     def stage(self, stage: str, progress: int, **kwargs):
         """Log a stage transition for progress tracking"""
-        self.info(f"Stage: {stage}", stage=stage, progress=progress, **kwargs)
+        self._log(logging.INFO, "Stage: %s", (stage,), dict(stage=stage, progress=progress, **kwargs))
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queues records unformatted, with the correlation context captured.
+
+    Context vars are only visible on the logging thread, so they are copied
+    onto the record here; formatting then runs on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.correlation_context = correlation_context_var.get()
+        return record
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """Flushes the stream once the log queue has drained instead of per record.
+
+    Bursts of records go out in as few writes as the stream's buffer allows;
+    warnings and errors are still flushed immediately.
+    """
+    
+    def __init__(self, stream, log_queue: queue.SimpleQueue):
+        super().__init__(stream)
+        self._queue = log_queue
+    
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            super().flush()
+    
+    def flush(self):
+        if self._queue.empty():
+            super().flush()
+
+# Background thread writing queued log records; replaced on each setup_logging call
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records on interpreter exit"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+atexit.register(_stop_queue_listener)
 
 def setup_logging(level: str = "INFO", format: str = "auto"):
     """
@@ -176,7 +281,7 @@ def setup_logging(level: str = "INFO", format: str = "auto"):
     
     # Create formatter
     if format == "json":
-        formatter = StructuredFormatter()
+        formatter = StructuredFormatter(include_location=level.upper() == "DEBUG")
     else:
         formatter = DevelopmentFormatter()
     
@@ -188,10 +293,21 @@ def setup_logging(level: str = "INFO", format: str = "auto"):
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # The logging thread only enqueues records; a background listener thread
+    # serializes them and writes to stdout
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    log_queue = queue.SimpleQueue()
+    
+    console_handler = _BatchingStreamHandler(sys.stdout, log_queue)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    root_logger.addHandler(_ContextQueueHandler(log_queue))
+    
+    _queue_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
     
     # Suppress some noisy loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -210,28 +326,37 @@ def set_correlation_context(
     request_id: Optional[str] = None,
     task_id: Optional[str] = None,
     user_id: Optional[str] = None,
-):
-    """Set correlation context for the current async context"""
+) -> Token:
+    """Set correlation context for the current async context.
+
+    IDs that are not given keep their current value. Returns a token to pass
+    to clear_correlation_context.
+    """
+    context = dict(correlation_context_var.get())
     if correlation_id:
-        correlation_id_var.set(correlation_id)
+        context['correlationId'] = correlation_id
     if request_id:
-        request_id_var.set(request_id)
+        context['requestId'] = request_id
     if task_id:
-        task_id_var.set(task_id)
+        context['taskId'] = task_id
     if user_id:
-        user_id_var.set(user_id)
+        context['userId'] = user_id
+    return correlation_context_var.set(context)
+
+def clear_correlation_context(token: Optional[Token] = None):
+    """Restore the correlation context saved by set_correlation_context.
 
-def clear_correlation_context():
-    """Clear correlation context"""
-    correlation_id_var.set(None)
-    request_id_var.set(None)
-    task_id_var.set(None)
-    user_id_var.set(None)
+    Without a token the context is emptied (deprecated).
+    """
+    if token is None:
+        correlation_context_var.set({})
+    else:
+        correlation_context_var.reset(token)
 
 def get_correlation_id() -> Optional[str]:
     """Get current correlation ID"""
-    return correlation_id_var.get()
+    return correlation_context_var.get().get('correlationId')
 
 def get_task_id() -> Optional[str]:
     """Get current task ID"""
-    return task_id_var.get()
\ No newline at end of file
+    return correlation_context_var.get().get('taskId')
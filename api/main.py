@@ -1,2 +1,18 @@
 # Use the app from index.py which has all the routers configured
-from index import app
\ No newline at end of file
+from index import app
+
+if __name__ == "__main__":
+    # Self-hosted entry point (Vercel imports `handler` from index.py instead).
+    # uvloop/httptools replace the default asyncio loop and h11 parser.
+    import os
+    import uvicorn
+    
+    uvicorn.run(
+        "index:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        log_level=os.getenv("UVICORN_LOG_LEVEL", "warning"),
+    )
@@ -2,11 +2,14 @@
 Correlation ID middleware for FastAPI
 """
 
-import uuid
+import itertools
+import logging
+import os
 from typing import Optional
+from urllib.parse import parse_qsl
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from logging_config import (
     set_correlation_context,
@@ -16,31 +19,90 @@ from logging_config import (
 
 logger = get_logger(__name__)
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle correlation IDs across requests"""
+# Random bytes for request IDs are read from the OS in batches, so most
+# requests get their IDs without an os.urandom call
+_RAND_BATCH = 4096
+_rand_buf = b""
+_rand_pos = 0
+
+def _reset_rand_buf():
+    """Forked workers must not hand out the parent's remaining bytes"""
+    global _rand_buf, _rand_pos
+    _rand_buf = b""
+    _rand_pos = 0
+
+os.register_at_fork(after_in_child=_reset_rand_buf)
+
+# Health probes and progress polls arrive several times a second and are
+# almost always uneventful; only 1 in REQUEST_LOG_SAMPLE_RATIO of them is
+# logged, while any that fail or return 4xx/5xx are always logged
+_SAMPLED_PATH_PREFIXES = ("/api/health", "/api/progress/")
+_SAMPLE_RATIO = max(1, int(os.getenv("REQUEST_LOG_SAMPLE_RATIO", "100")))
+_sample_counter = itertools.count()
+
+def _fast_uuid() -> str:
+    """Random (version 4) UUID string, same format as str(uuid.uuid4())"""
+    global _rand_buf, _rand_pos
+    if _rand_pos >= len(_rand_buf):
+        _rand_buf = os.urandom(_RAND_BATCH)
+        _rand_pos = 0
+    raw = bytearray(_rand_buf[_rand_pos:_rand_pos + 16])
+    _rand_pos += 16
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+class CorrelationMiddleware:
+    """Middleware to handle correlation IDs across requests.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so requests are not run in an
+    extra task with the response body relayed through a memory stream.
+    """
     
     CORRELATION_HEADER = "x-correlation-id"
     REQUEST_ID_HEADER = "x-request-id"
     TASK_ID_HEADER = "x-task-id"
     USER_ID_HEADER = "x-user-id"
     
-    async def dispatch(self, request: Request, call_next):
+    _HEADER_NAMES = {
+        CORRELATION_HEADER.encode(): "correlation_id",
+        REQUEST_ID_HEADER.encode(): "request_id",
+        TASK_ID_HEADER.encode(): "task_id",
+        USER_ID_HEADER.encode(): "user_id",
+    }
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Pick the correlation headers straight out of the raw header list
+        ids = {}
+        for name, value in scope["headers"]:
+            key = self._HEADER_NAMES.get(name)
+            if key is not None and key not in ids:
+                ids[key] = value.decode("latin-1")
+        
         # Extract or generate correlation ID
-        correlation_id = request.headers.get(self.CORRELATION_HEADER)
+        correlation_id = ids.get("correlation_id")
         if not correlation_id:
-            correlation_id = f"api-{uuid.uuid4()}"
+            correlation_id = f"api-{_fast_uuid()}"
         
         # Generate request ID
-        request_id = request.headers.get(self.REQUEST_ID_HEADER)
+        request_id = ids.get("request_id")
         if not request_id:
-            request_id = f"req-{uuid.uuid4()}"
+            request_id = f"req-{_fast_uuid()}"
         
         # Extract optional IDs
-        task_id = request.headers.get(self.TASK_ID_HEADER)
-        user_id = request.headers.get(self.USER_ID_HEADER)
+        task_id = ids.get("task_id")
+        user_id = ids.get("user_id")
         
         # Set correlation context for logging
-        set_correlation_context(
+        context_token = set_correlation_context(
             correlation_id=correlation_id,
             request_id=request_id,
             task_id=task_id,
@@ -48,57 +110,78 @@ class CorrelationMiddleware(BaseHTTPMiddleware):
         )
         
         # Store in request state for access in endpoints
-        request.state.correlation_id = correlation_id
-        request.state.request_id = request_id
-        request.state.task_id = task_id
-        request.state.user_id = user_id
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = correlation_id
+        state["request_id"] = request_id
+        state["task_id"] = task_id
+        state["user_id"] = user_id
         
-        # Log request start
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params),
+        method = scope["method"]
+        path = scope["path"]
+        
+        # Polling requests are logged only when sampled (see _SAMPLE_RATIO)
+        log_request = (
+            not path.startswith(_SAMPLED_PATH_PREFIXES)
+            or next(_sample_counter) % _SAMPLE_RATIO == 0
         )
         
+        # Log request start; the query string is only parsed when the record
+        # will be emitted and there is one to parse
+        if log_request and logger.logger.isEnabledFor(logging.INFO):
+            query_string = scope.get("query_string")
+            logger.info(
+                "Request started: %s %s", method, path,
+                method=method,
+                path=path,
+                query_params=dict(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)) if query_string else {},
+            )
+        
+        status_code = None
+        
+        async def send_with_correlation(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                
+                # Add correlation headers to response
+                headers = MutableHeaders(scope=message)
+                headers[self.CORRELATION_HEADER] = correlation_id
+                headers[self.REQUEST_ID_HEADER] = request_id
+                if task_id:
+                    headers[self.TASK_ID_HEADER] = task_id
+            await send(message)
+        
         try:
             # Process request
-            response = await call_next(request)
-            
-            # Add correlation headers to response
-            response.headers[self.CORRELATION_HEADER] = correlation_id
-            response.headers[self.REQUEST_ID_HEADER] = request_id
-            if task_id:
-                response.headers[self.TASK_ID_HEADER] = task_id
+            await self.app(scope, receive, send_with_correlation)
             
             # Log request completion
-            logger.info(
-                f"Request completed: {request.method} {request.url.path}",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-            )
-            
-            return response
+            if log_request or (status_code or 0) >= 400:
+                logger.info(
+                    "Request completed: %s %s", method, path,
+                    method=method,
+                    path=path,
+                    status_code=status_code,
+                )
             
         except Exception as e:
             # Log error
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                "Request failed: %s %s", method, path,
                 error=e,
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
             )
             raise
         finally:
             # Clear correlation context
-            clear_correlation_context()
+            clear_correlation_context(context_token)
 
 def extract_correlation_id(request: Request) -> str:
     """Extract correlation ID from request"""
     if hasattr(request.state, 'correlation_id'):
         return request.state.correlation_id
-    return request.headers.get('x-correlation-id', f"api-{uuid.uuid4()}")
+    return request.headers.get('x-correlation-id') or f"api-{_fast_uuid()}"
 
 def extract_task_id(request: Request) -> Optional[str]:
     """Extract task ID from request"""
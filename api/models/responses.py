@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -99,7 +99,7 @@ class SummarizeResponse(BaseModel):
     key_points: List[str]
     user_id: str
     task_id: Optional[str] = None  # Add task_id for progress tracking
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = Field(default_factory=datetime.utcnow)
     
     # Enhanced YouTube metadata fields
     description: Optional[str] = None
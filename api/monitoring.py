@@ -13,17 +13,28 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import os
 import httpx
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp, Scope, Receive, Send
-import sys
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Scope, Receive, Send
 
-sys.path.insert(0, os.path.dirname(__file__))
 from logging_config import get_logger
 from utils.circuit_breaker import service_breakers
 
 logger = get_logger(__name__)
 
+# Same text on every call, so asyncpg's per-connection statement cache parses
+# and plans it once per pooled connection
+_DB_STATS_QUERY = """
+    SELECT 
+        numbackends as connections,
+        xact_commit as commits,
+        xact_rollback as rollbacks,
+        blks_read as blocks_read,
+        blks_hit as blocks_hit
+    FROM pg_stat_database 
+    WHERE datname = current_database()
+"""
+
 
 @dataclass
 class ResourceMetrics:
@@ -53,23 +64,30 @@ class FastAPIMonitoring:
         self.cpu_threshold = 90  # percent
         self.connection_threshold = 90  # percent of pool
         
+        # Primed once so later cpu_percent(interval=None) calls return the
+        # usage since the previous call without sleeping
+        self._process = psutil.Process()
+        self._process.cpu_percent(interval=None)
+        
+        # Read once; health checks are polled far more often than the env changes
+        self._db_url = os.getenv("DATABASE_URL", "")
+        
+        # Small pool for database health checks when no shared pool is passed in
+        self._health_pool: Optional[asyncpg.Pool] = None
+        self._health_pool_lock = asyncio.Lock()
+        
     async def get_resource_metrics(self, progress_storage=None) -> ResourceMetrics:
         """Get current resource usage metrics."""
-        process = psutil.Process()
+        process = self._process
         memory_info = process.memory_info()
         
         # Get database pool stats if available
-        pool_size = 0
-        active_connections = 0
-        
-        if progress_storage and hasattr(progress_storage, 'pool') and progress_storage.pool:
-            pool_size = progress_storage.pool._maxsize if hasattr(progress_storage.pool, '_maxsize') else 0
-            active_connections = len(progress_storage.pool._holders) if hasattr(progress_storage.pool, '_holders') else 0
+        pool_size, active_connections = progress_storage.get_pool_stats() if progress_storage else (0, 0)
         
         return ResourceMetrics(
             memory_usage_mb=round(memory_info.rss / 1024 / 1024, 2),
             memory_percent=process.memory_percent(),
-            cpu_percent=process.cpu_percent(interval=0.1),
+            cpu_percent=process.cpu_percent(interval=None),
             disk_usage_percent=psutil.disk_usage('/').percent,
             connection_pool_size=pool_size,
             active_connections=active_connections,
@@ -84,13 +102,13 @@ class FastAPIMonitoring:
         # Memory threshold
         if metrics.memory_percent > self.memory_threshold:
             alert = f"High memory usage: {metrics.memory_percent:.1f}%"
-            logger.warning(f"🚨 {alert}")
+            logger.warning("🚨 %s", alert)
             alerts.append(alert)
         
         # CPU threshold
         if metrics.cpu_percent > self.cpu_threshold:
             alert = f"High CPU usage: {metrics.cpu_percent:.1f}%"
-            logger.warning(f"🚨 {alert}")
+            logger.warning("🚨 %s", alert)
             alerts.append(alert)
         
         # Connection pool threshold
@@ -98,7 +116,7 @@ class FastAPIMonitoring:
             pool_usage_percent = (metrics.active_connections / metrics.connection_pool_size) * 100
             if pool_usage_percent > self.connection_threshold:
                 alert = f"High database connection usage: {pool_usage_percent:.1f}%"
-                logger.warning(f"🚨 {alert}")
+                logger.warning("🚨 %s", alert)
                 alerts.append(alert)
         
         return {
@@ -113,36 +131,41 @@ class FastAPIMonitoring:
             "timestamp": metrics.timestamp.isoformat()
         }
     
-    async def check_database_health(self, db_url: str) -> Dict[str, Any]:
-        """Check database connectivity and performance."""
-        start_time = time.time()
+    async def _get_health_pool(self, db_url: str) -> asyncpg.Pool:
+        """Create the health-check pool on first use."""
+        if self._health_pool is None:
+            async with self._health_pool_lock:
+                if self._health_pool is None:
+                    # Parse connection string
+                    from services.progress_storage import parse_database_url
+                    conn_params = parse_database_url(db_url)
+                    self._health_pool = await asyncpg.create_pool(**conn_params, min_size=1, max_size=2)
+        return self._health_pool
+    
+    async def close(self):
+        """Close the health-check pool, if one was created."""
+        if self._health_pool is not None:
+            await self._health_pool.close()
+            self._health_pool = None
+    
+    async def check_database_health(self, db_url: Optional[str] = None, pool: Optional[asyncpg.Pool] = None) -> Dict[str, Any]:
+        """Check database connectivity and performance.
+        
+        Uses the given pool (normally the progress storage pool) so checks
+        don't open a new connection each time. db_url defaults to DATABASE_URL
+        as read at startup.
+        """
+        start_time = time.perf_counter()
         
         try:
-            # Parse connection string
-            from services.progress_storage import parse_database_url
-            conn_params = parse_database_url(db_url)
-            
-            # Test connection
-            conn = await asyncpg.connect(**conn_params)
+            if pool is None:
+                pool = await self._get_health_pool(db_url or self._db_url)
             
-            # Run simple query
-            result = await conn.fetchval("SELECT 1")
+            async with pool.acquire() as conn:
+                # Get database stats; this round trip doubles as the connectivity probe
+                db_stats = await conn.fetchrow(_DB_STATS_QUERY)
             
-            # Get database stats
-            db_stats = await conn.fetchrow("""
-                SELECT 
-                    numbackends as connections,
-                    xact_commit as commits,
-                    xact_rollback as rollbacks,
-                    blks_read as blocks_read,
-                    blks_hit as blocks_hit
-                FROM pg_stat_database 
-                WHERE datname = current_database()
-            """)
-            
-            await conn.close()
-            
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             
             return {
                 "status": "healthy",
@@ -154,11 +177,37 @@ class FastAPIMonitoring:
             }
             
         except Exception as e:
-            logger.error(f"Database health check failed: {str(e)}")
+            logger.error("Database health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "response_time_ms": round((time.time() - start_time) * 1000, 2)
+                "response_time_ms": round((time.perf_counter() - start_time) * 1000, 2)
+            }
+    
+    async def _probe_service(self, client: httpx.AsyncClient, name: str, url: str) -> Dict[str, Any]:
+        """Check a single external service."""
+        start_time = time.perf_counter()
+        
+        try:
+            # Add API key for OpenAI
+            headers = {}
+            if name == "openai" and os.getenv("OPENAI_API_KEY"):
+                headers["Authorization"] = f"Bearer {os.getenv('OPENAI_API_KEY')}"
+            
+            response = await client.get(url, headers=headers)
+            response_time = (time.perf_counter() - start_time) * 1000
+            
+            return {
+                "status": "healthy" if response.status_code < 500 else "degraded",
+                "response_code": response.status_code,
+                "response_time_ms": round(response_time, 2)
+            }
+            
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+                "response_time_ms": round((time.perf_counter() - start_time) * 1000, 2)
             }
     
     async def check_external_services(self) -> Dict[str, Any]:
@@ -168,35 +217,13 @@ class FastAPIMonitoring:
             "openai": "https://api.openai.com/v1/models"
         }
         
-        results = {}
-        
+        # Probe all services at once so a slow one doesn't delay the others
         async with httpx.AsyncClient(timeout=5.0) as client:
-            for name, url in services.items():
-                start_time = time.time()
-                
-                try:
-                    # Add API key for OpenAI
-                    headers = {}
-                    if name == "openai" and os.getenv("OPENAI_API_KEY"):
-                        headers["Authorization"] = f"Bearer {os.getenv('OPENAI_API_KEY')}"
-                    
-                    response = await client.get(url, headers=headers)
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    results[name] = {
-                        "status": "healthy" if response.status_code < 500 else "degraded",
-                        "response_code": response.status_code,
-                        "response_time_ms": round(response_time, 2)
-                    }
-                    
-                except Exception as e:
-                    results[name] = {
-                        "status": "unhealthy",
-                        "error": str(e),
-                        "response_time_ms": round((time.time() - start_time) * 1000, 2)
-                    }
+            results = await asyncio.gather(
+                *(self._probe_service(client, name, url) for name, url in services.items())
+            )
         
-        return results
+        return dict(zip(services, results))
     
     async def get_comprehensive_health(self, progress_storage=None) -> Dict[str, Any]:
         """Get comprehensive health status."""
@@ -204,14 +231,12 @@ class FastAPIMonitoring:
         uptime_seconds = time.time() - self.start_time
         avg_request_time = self.total_request_time / max(self.request_count, 1)
         
-        # Resource metrics
-        resources = await self.check_resource_thresholds(progress_storage)
-        
-        # Database health
-        db_health = await self.check_database_health(os.getenv("DATABASE_URL", ""))
-        
-        # External services
-        external_services = await self.check_external_services()
+        # Resource metrics, database health and external services are independent
+        resources, db_health, external_services = await asyncio.gather(
+            self.check_resource_thresholds(progress_storage),
+            self.check_database_health(pool=getattr(progress_storage, "pool", None)),
+            self.check_external_services(),
+        )
         
         # Circuit breaker status
         circuit_breakers = service_breakers.get_all_stats()
@@ -256,33 +281,39 @@ class FastAPIMonitoring:
             self.error_count += 1
 
 
-class ResourceMonitoringMiddleware(BaseHTTPMiddleware):
+class ResourceMonitoringMiddleware:
     """Middleware for monitoring resource usage."""
     
     def __init__(self, app: ASGIApp, monitoring: FastAPIMonitoring):
-        super().__init__(app)
+        self.app = app
         self.monitoring = monitoring
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Monitor resources during request processing."""
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
         
         # Check resources before processing (only on health endpoints)
-        if request.url.path.startswith("/api/health"):
+        if scope["path"].startswith("/api/health"):
             await self.monitoring.check_resource_thresholds()
         
-        # Process request
-        response = await call_next(request)
-        
-        # Record metrics
-        duration = time.time() - start_time
-        self.monitoring.record_request(duration, response.status_code)
-        
-        # Add monitoring headers
-        response.headers["X-Response-Time"] = str(round(duration * 1000, 2))
-        response.headers["X-Request-ID"] = request.state.correlation_id if hasattr(request.state, 'correlation_id') else ""
+        async def send_with_metrics(message: Message):
+            if message["type"] == "http.response.start":
+                # Record metrics
+                duration = time.perf_counter() - start_time
+                self.monitoring.record_request(duration, message["status"])
+                
+                # Add monitoring headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Response-Time"] = str(round(duration * 1000, 2))
+                headers["X-Request-ID"] = scope.get("state", {}).get("correlation_id", "")
+            await send(message)
         
-        return response
+        # Process request
+        await self.app(scope, receive, send_with_metrics)
 
 
 # Global monitoring instance
@@ -309,7 +340,8 @@ def setup_monitoring(app: FastAPI):
     @app.get("/api/health/database")
     async def database_health():
         """Database connectivity health check."""
-        return await monitoring.check_database_health(os.getenv("DATABASE_URL", ""))
+        from services.progress_storage import progress_storage
+        return await monitoring.check_database_health(pool=progress_storage.pool)
     
     @app.get("/api/health/circuit-breakers")
     async def circuit_breaker_health():
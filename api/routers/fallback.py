@@ -0,0 +1,430 @@
+"""Fallback summarization endpoints, registered when the full routers can't be imported."""
+
+import asyncio
+import os
+import string
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from logging_config import get_logger, set_correlation_context
+from middleware.correlation import extract_correlation_id
+from models.requests import SummarizeRequest
+from services.progress_storage import (
+    progress_storage,
+    STATUS_PROCESSING,
+    STATUS_COMPLETED,
+    STATUS_ERROR,
+    STAGE_QUEUED,
+    STAGE_INITIALIZING,
+    STAGE_FETCHING,
+    STAGE_ANALYZING,
+    STAGE_GENERATING,
+    STAGE_READY,
+)
+from services.summary_result import to_api_dict
+from utils.environment import is_development
+
+router = APIRouter(tags=["fallback"])
+logger = get_logger(__name__)
+
+# Synthetic test logs keep their own components so existing log queries still match
+_synthetic_logger = get_logger("api.synthetic")
+_synthetic_progress_logger = get_logger("api.synthetic.progress")
+
+# YouTube video IDs are exactly 11 characters of [A-Za-z0-9_-] following one
+# of these fixed prefixes, so plain str.find() slicing replaces a regex scan
+_YT_ID_PREFIXES = ("watch?v=", "&v=", "youtu.be/", "/embed/")
+_YT_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+@lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> Optional[str]:
+    """Extract the video ID from a YouTube URL"""
+    if "youtube.com" not in url and "youtu.be" not in url:
+        return None
+
+    for prefix in _YT_ID_PREFIXES:
+        idx = url.find(prefix)
+        if idx != -1:
+            start = idx + len(prefix)
+            candidate = url[start:start + 11]
+            if len(candidate) == 11 and _YT_ID_CHARS.issuperset(candidate):
+                return candidate
+
+    return None
+
+# Summarization services are imported on first use, so cold starts that only
+# serve health or progress requests never load them; constructed once after that
+@lru_cache(maxsize=None)
+def _get_services():
+    """Return the shared (YouTubeService, LangChainService) pair"""
+    from services.youtube_service import get_youtube_service
+    from services.langchain_service import LangChainService
+    return get_youtube_service(), LangChainService()
+
+@lru_cache(maxsize=None)
+def _get_metadata_service():
+    """Return the shared YouTubeMetadataService"""
+    from services.youtube_metadata_service import YouTubeMetadataService
+    return YouTubeMetadataService()
+
+# Error messages returned in the response body; raw exception text only in development
+_EXPOSE_ERRORS = is_development()
+_ERR_SERVICES_UNAVAILABLE = "Summarization services are unavailable"
+_ERR_SUMMARIZATION_FAILED = "Summarization failed"
+_ERR_SUMMARIZATION_FAILED_STAGE = "Error: Summarization failed"
+_ERR_REFRESH_FAILED = "Failed to refresh metadata"
+
+# Bounds concurrent LLM summarizations per worker; excess requests wait here
+_SUMMARIZE_SEM = asyncio.Semaphore(int(os.getenv("SUMMARIZE_CONCURRENCY", "8")))
+
+# Summarization pipelines currently running, keyed by video ID
+_inflight: Dict[str, asyncio.Future] = {}
+
+# Progress queues for clients streaming a summary over SSE, keyed by task ID
+_progress_listeners: Dict[str, asyncio.Queue] = {}
+
+# Latest pending progress write per task; each write waits for the one before it
+_progress_writes: Dict[str, asyncio.Task] = {}
+
+async def _write_progress(task_id: str, snapshot: dict, previous: Optional[asyncio.Task]):
+    """Persist one progress snapshot once the task's previous write has landed"""
+    if previous is not None:
+        await previous
+    try:
+        await progress_storage.set_progress(task_id, snapshot)
+    except Exception as e:
+        logger.error("Failed to persist progress", error=e, task_id=task_id)
+
+async def _update_progress(state: dict, progress: int, stage: str, status: str = STATUS_PROCESSING):
+    """Update a task's progress record in place and persist it.
+
+    Intermediate writes run in the background, chained per task so they land in
+    order; the final completed/error write is awaited so it is stored before the
+    response goes out.
+    """
+    state["progress"] = progress
+    state["stage"] = stage
+    state["status"] = status
+
+    task_id = state["task_id"]
+    snapshot = dict(state)
+    write = asyncio.create_task(_write_progress(task_id, snapshot, _progress_writes.pop(task_id, None)))
+    if status == STATUS_PROCESSING:
+        _progress_writes[task_id] = write
+        write.add_done_callback(
+            lambda done: _progress_writes.pop(task_id, None) if _progress_writes.get(task_id) is done else None
+        )
+    else:
+        await write
+
+    listener = _progress_listeners.get(task_id)
+    if listener is not None:
+        listener.put_nowait(("progress", snapshot))
+
+async def _stream_summary(url: str, state: dict):
+    """Run the summary pipeline, yielding each progress update and the result as SSE"""
+    task_id = state["task_id"]
+    events = _progress_listeners[task_id] = asyncio.Queue()
+
+    async def run():
+        try:
+            result = await _run_summary(url, state)
+        finally:
+            _progress_listeners.pop(task_id, None)
+        events.put_nowait(("result", result))
+
+    job = asyncio.create_task(run())
+    while True:
+        event, payload = await events.get()
+        yield f"event: {event}\ndata: {orjson.dumps(payload).decode()}\n\n"
+        if event == "result":
+            break
+    await job
+
+# Working summarize endpoint
+@router.post("/summarize")
+async def working_summarize(body: SummarizeRequest, request: Request):
+    """Summarize a video. Clients sending Accept: text/event-stream receive
+    progress and the final result as Server-Sent Events instead of polling
+    /api/progress/{task_id}."""
+    # Extract correlation ID from request state (set by middleware)
+    cid = extract_correlation_id(request)
+
+    # Generate task ID immediately
+    task_id = str(uuid.uuid4())
+
+    # Set task ID in logging context
+    set_correlation_context(task_id=task_id)
+
+    # One progress record per task, updated in place at each stage
+    state = {"progress": 0, "stage": STAGE_INITIALIZING, "status": STATUS_PROCESSING, "task_id": task_id, "cid": cid}
+
+    url = body.url
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(_stream_summary(url, state), media_type="text/event-stream")
+    return await _run_summary(url, state)
+
+async def _fetch_and_summarize(video_id: str, url: str, state: dict):
+    """Fetch video data and transcript, then summarize it.
+
+    Returns (video_info, transcript, is_gumloop, summary); transcript and
+    summary are None when no transcript is available.
+    """
+    youtube_service, langchain_service = _get_services()
+
+    # Get real video info and transcript
+    logger.debug("Processing video", video_id=video_id, task_id=state["task_id"])
+
+    # Update progress: Getting video info and transcript in parallel
+    await _update_progress(state, 25, STAGE_FETCHING)
+    video_info, (transcript, is_gumloop) = await youtube_service.get_video_data_parallel(video_id)
+    logger.info("Video info retrieved",
+               title=video_info.title,
+               channel=video_info.channel_name,
+               views=video_info.view_count,
+               transcript_source="gumloop" if is_gumloop else "standard")
+
+    if not transcript:
+        return video_info, None, is_gumloop, None
+
+    logger.debug("Retrieved transcript", characters=len(transcript))
+
+    # Update progress: Analyzing content
+    await _update_progress(state, 60, STAGE_ANALYZING)
+
+    # Let the client see it is waiting when every summarization slot is taken
+    if _SUMMARIZE_SEM.locked():
+        await _update_progress(state, 60, STAGE_QUEUED)
+
+    async with _SUMMARIZE_SEM:
+        # Update progress: Generating summary
+        await _update_progress(state, 80, STAGE_GENERATING)
+        summary = await langchain_service.summarize_transcript(
+            transcript=transcript,
+            video_title=video_info.title,
+            channel_name=video_info.channel_name,
+            video_url=url
+        )
+
+    return video_info, transcript, is_gumloop, summary
+
+async def _run_summary(url: str, state: dict) -> dict:
+    """Fetch, summarize and shape the result for one video, reporting progress through state"""
+    task_id = state["task_id"]
+    cid = state["cid"]
+
+    try:
+        # Raises ImportError if the services can't be loaded in this deployment
+        _get_services()
+
+        # Structured logging with correlation ID
+        logger.info("Starting summarization", 
+                   url=url,
+                   task_id=task_id)
+        if not url:
+            await _update_progress(state, 0, "Error: URL is required", STATUS_ERROR)
+            return {"error": "URL is required", "task_id": task_id, "cid": cid}
+
+        # Initialize progress tracking immediately
+        await _update_progress(state, 5, STAGE_INITIALIZING)
+
+        # Extract video ID
+        video_id = _extract_video_id(url)
+
+        if not video_id:
+            await _update_progress(state, 0, "Error: Invalid YouTube URL", STATUS_ERROR)
+            return {"error": "Invalid YouTube URL", "task_id": task_id, "cid": cid}
+
+        # Requests for a video that is already being summarized share that
+        # pipeline instead of fetching and summarizing it again
+        pipeline = _inflight.get(video_id)
+        if pipeline is None:
+            pipeline = _inflight[video_id] = asyncio.ensure_future(_fetch_and_summarize(video_id, url, state))
+            pipeline.add_done_callback(lambda _: _inflight.pop(video_id, None))
+        else:
+            logger.debug("Joining in-flight summarization", video_id=video_id, task_id=task_id)
+            await _update_progress(state, 80, STAGE_GENERATING)
+
+        # Shielded so one client disconnecting doesn't cancel the shared pipeline
+        video_info, transcript, is_gumloop, summary = await asyncio.shield(pipeline)
+
+        if not transcript:
+            await _update_progress(state, 40, "Error: No transcript available", STATUS_ERROR)
+            return {"error": "Could not retrieve transcript for this video. The video may not have captions available.", "task_id": task_id}
+
+        result = to_api_dict(
+            summary,
+            video_info,
+            video_id=video_id,
+            url=url,
+            task_id=task_id,
+            is_gumloop=is_gumloop,
+        )
+
+        # Update progress: Complete - this is critical for frontend coordination
+        await _update_progress(state, 100, STAGE_READY, STATUS_COMPLETED)
+        logger.debug("Progress marked as complete", task_id=task_id)
+
+        logger.debug("Returning result", task_id=task_id)
+        return result
+
+    except ImportError as e:
+        await _update_progress(state, 0, _ERR_SERVICES_UNAVAILABLE, STATUS_ERROR)
+        logger.error("Summarization services unavailable", error=e, task_id=task_id)
+        return {"error": _ERR_SERVICES_UNAVAILABLE, "task_id": task_id}
+    except Exception as e:
+        # Always update progress with error state; exception text is only exposed in development
+        logger.error("Error in summarization", error=e, task_id=task_id)
+        if _EXPOSE_ERRORS:
+            error_msg = f"Summarization failed: {str(e)}"
+            stage = f"Error: {str(e)}"
+        else:
+            error_msg = _ERR_SUMMARIZATION_FAILED
+            stage = _ERR_SUMMARIZATION_FAILED_STAGE
+        await _update_progress(state, 0, stage, STATUS_ERROR)
+        return {"error": error_msg, "task_id": task_id}
+
+# Create a test endpoint to debug
+@router.post("/test-summarize")
+async def test_summarize(body: SummarizeRequest):
+    return {
+        "status": "test_success",
+        "url": body.url,
+        "message": "Test endpoint working"
+    }
+
+# Metadata refresh endpoint
+@router.post("/refresh-metadata")
+async def refresh_metadata(request: Request):
+    """Refresh YouTube metadata for an existing summary"""
+    try:
+        body = await request.json()
+        video_id = body.get("video_id")
+
+        if not video_id:
+            raise HTTPException(status_code=400, detail="video_id is required")
+
+        # Extract correlation ID
+        cid = extract_correlation_id(request)
+
+        logger.info("Refreshing metadata", video_id=video_id, cid=cid)
+
+        # Initialize metadata service
+        metadata_service = _get_metadata_service()
+
+        # Fetch fresh metadata
+        metadata = await metadata_service.get_metadata(video_id)
+
+        # Format response
+        result = {
+            "video_id": video_id,
+            "title": metadata.get('title'),
+            "description": metadata.get('description'),
+            "channel_name": metadata.get('channel_name'),
+            "view_count": metadata.get('view_count'),
+            "like_count": metadata.get('like_count'),
+            "comment_count": metadata.get('comment_count'),
+            "upload_date": metadata.get('upload_date').isoformat() if metadata.get('upload_date') else None,
+            "duration": metadata.get('duration'),
+            "thumbnail_url": metadata.get('thumbnail_url'),
+            "refreshed_at": datetime.now().isoformat(),
+            "cid": cid
+        }
+
+        logger.info("Metadata refreshed successfully", 
+                   video_id=video_id, 
+                   view_count=result.get('view_count'),
+                   cid=cid)
+
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to refresh metadata", error=e)
+        raise HTTPException(status_code=500, detail=_ERR_REFRESH_FAILED)
+
+# Development-only synthetic test endpoint (always enabled for local testing)
+if True:  # Enable for testing - normally: os.getenv("NODE_ENV") == "development"
+    @router.post("/dev/synthetic")
+    async def synthetic_summary(request: Request):
+        """Synthetic test endpoint that triggers a fixed public video summary with correlation tracking"""
+        # Generate correlation ID
+        cid = request.headers.get("x-correlation-id", str(uuid.uuid4()))
+
+        # Fixed public test video (Rick Astley - Never Gonna Give You Up)
+        TEST_VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        # Generate task ID
+        task_id = str(uuid.uuid4())
+
+        # Structured logging with correlation ID
+        _synthetic_logger.info("Starting synthetic summary test",
+                               cid=cid, task_id=task_id, video_url=TEST_VIDEO_URL)
+
+        try:
+            # Initialize progress with correlation ID
+            await progress_storage.set_progress(task_id, {
+                "progress": 5,
+                "stage": "Synthetic test starting...",
+                "status": STATUS_PROCESSING,
+                "task_id": task_id,
+                "cid": cid
+            })
+
+            # Log progress update
+            _synthetic_progress_logger.info("Progress initialized", cid=cid, task_id=task_id, progress=5)
+
+            # Simulate processing stages with delays
+            stages = [
+                (25, "Fetching test video data..."),
+                (50, "Processing synthetic transcript..."),
+                (75, "Generating test summary..."),
+                (100, "Synthetic test complete!")
+            ]
+
+            for progress, stage in stages:
+                await asyncio.sleep(0.5)  # Simulate processing time
+                await progress_storage.set_progress(task_id, {
+                    "progress": progress,
+                    "stage": stage,
+                    "status": STATUS_COMPLETED if progress == 100 else STATUS_PROCESSING,
+                    "task_id": task_id,
+                    "cid": cid
+                })
+
+                _synthetic_progress_logger.stage(stage, progress, cid=cid, task_id=task_id)
+
+            # Return response with correlation ID
+            response = {
+                "task_id": task_id,
+                "cid": cid,
+                "video_url": TEST_VIDEO_URL,
+                "message": "Synthetic test initiated successfully",
+                "poll_endpoint": f"/api/progress/{task_id}"
+            }
+
+            _synthetic_logger.info("Synthetic test completed", cid=cid, task_id=task_id, response=response)
+
+            return response
+
+        except Exception as e:
+            error_msg = f"Synthetic test failed: {str(e)}"
+            await progress_storage.set_progress(task_id, {
+                "progress": 0,
+                "stage": f"Error: {str(e)}",
+                "status": STATUS_ERROR,
+                "task_id": task_id,
+                "cid": cid
+            })
+
+            _synthetic_logger.error(error_msg, error=e, cid=cid, task_id=task_id)
+
+            return {"error": error_msg, "task_id": task_id, "cid": cid}
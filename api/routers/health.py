@@ -1,5 +1,6 @@
 """Health check endpoints for monitoring and deployment validation."""
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Dict, Any
 import asyncio
@@ -9,10 +10,30 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from config import settings
-from services.youtube_service import YouTubeService
-from services.gumloop_service import GumloopService
+from services.youtube_service import get_youtube_service
 
-router = APIRouter(tags=["health"])
+# CPU usage is sampled in the background so /health never sleeps to measure it
+_CPU_SAMPLE_INTERVAL = 5  # seconds
+_cpu_percent = 0.0
+_process = psutil.Process()
+
+async def _sample_cpu():
+    """Refresh the system-wide CPU usage every _CPU_SAMPLE_INTERVAL seconds"""
+    global _cpu_percent
+    while True:
+        await asyncio.sleep(_CPU_SAMPLE_INTERVAL)
+        _cpu_percent = psutil.cpu_percent(interval=None)
+
+@asynccontextmanager
+async def _lifespan(app):
+    """Run the CPU sampler for as long as the app is up"""
+    psutil.cpu_percent(interval=None)  # Prime the counter; the first call always returns 0.0
+    sampler = asyncio.create_task(_sample_cpu())
+    yield
+    sampler.cancel()
+    await asyncio.gather(sampler, return_exceptions=True)
+
+router = APIRouter(tags=["health"], lifespan=_lifespan)
 
 class HealthStatus(BaseModel):
     """Health check response model."""
@@ -43,8 +64,8 @@ async def health_check() -> HealthStatus:
         environment=os.getenv('NODE_ENV', 'development'),
         checks={
             "api": "operational",
-            "memory_usage_mb": round(psutil.Process().memory_info().rss / 1024 / 1024, 2),
-            "cpu_percent": psutil.cpu_percent(interval=0.1)
+            "memory_usage_mb": round(_process.memory_info().rss / 1024 / 1024, 2),
+            "cpu_percent": _cpu_percent
         }
     )
 
@@ -59,24 +80,22 @@ async def readiness_check() -> ReadinessStatus:
     details = {}
     
     # Check YouTube service
+    youtube_service = None
     try:
-        youtube_service = YouTubeService()
-        # Simple check - just verify the service initializes
+        youtube_service = get_youtube_service()
+        # Simple check - just verify the service initializes (built once, then reused)
         services_status["youtube"] = True
         details["youtube"] = "Service initialized"
     except Exception as e:
         services_status["youtube"] = False
         details["youtube"] = str(e)
     
-    # Check Gumloop service (if API key is configured)
+    # Check Gumloop service (if API key is configured) - the instance the
+    # shared YouTube service transcribes with, rather than a new one per probe
     if settings.gumloop_api_key:
-        try:
-            gumloop_service = GumloopService()
-            services_status["gumloop"] = True
-            details["gumloop"] = "Service initialized"
-        except Exception as e:
-            services_status["gumloop"] = False
-            details["gumloop"] = str(e)
+        gumloop_service = getattr(youtube_service, "gumloop_service", None)
+        services_status["gumloop"] = gumloop_service is not None and gumloop_service.is_ready
+        details["gumloop"] = "Service initialized" if services_status["gumloop"] else "Client not initialized"
     else:
         services_status["gumloop"] = False
         details["gumloop"] = "API key not configured"
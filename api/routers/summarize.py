@@ -3,24 +3,34 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, HttpUrl
 from typing import Optional
 import re
-import sys
-import os
 import uuid
-# Add parent directory to path to find other modules
-current_dir = os.path.dirname(__file__)
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+from functools import lru_cache
 
 from dependencies import get_current_user, User
-from services.youtube_service import YouTubeService
+from services.youtube_service import get_youtube_service
 from services.langchain_service import LangChainService
 from services.gumloop_parser import is_gumloop_summary, parse_gumloop_summary, extract_key_points_from_gumloop
 from services.progress_storage import progress_storage
 from models.requests import SummarizeRequest
 from models.responses import SummarizeResponse
 
+try:
+    # google-re2 matches in linear time with no backtracking; optional
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# YouTube URL pattern, compiled once at import. One alternation covers
+# watch?v=, watch?...&v= (first v= wins), youtu.be/ and embed/ in a single scan
+_VIDEO_ID_RE = _regex.compile(
+    r'(?:youtube\.com/watch\?(?:[^#\s]*?&)??v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})'
+)
+
+# Seconds per field of an "[[HH:]MM:]SS" duration, right-aligned
+_DUR_WEIGHTS = (1, 60, 3600)
+
 router = APIRouter()
-youtube_service = YouTubeService()
+youtube_service = get_youtube_service()
 langchain_service = LangChainService()
 
 @router.post("/summarize", response_model=SummarizeResponse)
@@ -130,13 +140,11 @@ async def summarize_video(
                     # Parse duration from format like "HH:MM:SS" to seconds
                     try:
                         parts = gumloop_data.duration.split(':')
-                        if len(parts) == 3:
-                            hours, minutes, seconds = map(int, parts)
-                            video_info.duration = hours * 3600 + minutes * 60 + seconds
-                        elif len(parts) == 2:
-                            minutes, seconds = map(int, parts)
-                            video_info.duration = minutes * 60 + seconds
-                    except:
+                        if len(parts) <= len(_DUR_WEIGHTS):
+                            video_info.duration = sum(
+                                int(p) * w for p, w in zip(reversed(parts), _DUR_WEIGHTS)
+                            )
+                    except (ValueError, AttributeError):
                         pass  # Keep original duration if parsing fails
                 
                 # Prepare structured data for frontend
@@ -151,8 +159,10 @@ async def summarize_video(
                     tone="informative"  # Default tone
                 )
                 
+                # parse_gumloop_summary only emits str fields (regex groups), so
+                # these trusted values skip per-item validation via model_construct
                 key_moments = [
-                    KeyMoment(timestamp=moment.timestamp, insight=moment.insight)
+                    KeyMoment.model_construct(timestamp=moment.timestamp, insight=moment.insight)
                     for moment in gumloop_data.key_moments
                 ]
                 
@@ -229,13 +239,13 @@ async def summarize_video(
                 glossary = []
                 if gumloop_data.accelerated_learning_pack:
                     flashcards = [
-                        Flashcard(question=card["question"], answer=card["answer"])
+                        Flashcard.model_construct(question=card["question"], answer=card["answer"])
                         for card in gumloop_data.accelerated_learning_pack.feynman_flashcards
                         if isinstance(card, dict) and "question" in card and "answer" in card
                     ]
                     
                     quiz_questions = [
-                        QuizQuestion(question=q["question"], answer=q["answer"])
+                        QuizQuestion.model_construct(question=q["question"], answer=q["answer"])
                         for q in gumloop_data.accelerated_learning_pack.quick_quiz
                         if isinstance(q, dict) and "question" in q and "answer" in q
                     ]
@@ -248,7 +258,7 @@ async def summarize_video(
                                 term_str = str(term["term"]) if term["term"] is not None else ""
                                 definition_str = str(term["definition"]) if term["definition"] is not None else ""
                                 if term_str and definition_str:
-                                    glossary.append(GlossaryTerm(term=term_str, definition=definition_str))
+                                    glossary.append(GlossaryTerm.model_construct(term=term_str, definition=definition_str))
                 
                 # Extract legacy tools and resources for backward compatibility
                 tools = []
@@ -401,16 +411,8 @@ async def refresh_metadata(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to refresh metadata: {str(e)}")
 
+@lru_cache(maxsize=4096)
 def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/watch\?.*v=([a-zA-Z0-9_-]{11})'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
\ No newline at end of file
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
\ No newline at end of file
@@ -1,18 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends
-import sys
-import os
-# Add parent directory to path to find other modules
-current_dir = os.path.dirname(__file__)
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
 
 from dependencies import get_current_user, User
-from services.youtube_service import YouTubeService
+from services.youtube_service import get_youtube_service
 from models.requests import TranscriptRequest
 from models.responses import TranscriptResponse
 
 router = APIRouter()
-youtube_service = YouTubeService()
+youtube_service = get_youtube_service()
 
 @router.post("/transcript", response_model=TranscriptResponse)
 async def get_transcript(
@@ -74,6 +74,32 @@ class GumloopSummary:
     full_content: str
 
 
+# Gumloop markdown markers checked by is_gumloop_summary
+_GUMLOOP_MARKERS = (
+    "## Video Context",
+    "**Title**",
+    "**Speakers**:",
+    "**Synopsis**:",
+    "## TL;DR",
+    "## TL;DR (≤100 words)",
+    "## Key Moments",
+    "## Strategic Frameworks",
+    "## Debunked Assumptions",
+    "## In Practice",
+    "## Playbooks & Heuristics",
+    "## Insight Enrichment",
+    "## Accelerated Learning Pack",
+    "### Feynman Flashcards",
+    "### Glossary",
+    "### Quick Quiz",
+    "### Novel-Idea Meter",
+    "## How to Think Like",
+)
+
+# How much of the content is searched for markers by is_gumloop_summary
+_GUMLOOP_HEADER_SCAN_CHARS = 8192
+
+
 def is_gumloop_summary(content: str) -> bool:
     """
     Detect if content is a Gumloop-formatted summary
@@ -87,33 +113,18 @@ def is_gumloop_summary(content: str) -> bool:
     if not content or len(content) < 100:
         return False
     
-    # Check for Gumloop markdown markers
-    gumloop_markers = [
-        "## Video Context",
-        "**Title**",
-        "**Speakers**:",
-        "**Synopsis**:",
-        "## TL;DR",
-        "## TL;DR (≤100 words)",
-        "## Key Moments",
-        "## Strategic Frameworks",
-        "## Debunked Assumptions", 
-        "## In Practice",
-        "## Playbooks & Heuristics",
-        "## Insight Enrichment",
-        "## Accelerated Learning Pack",
-        "### Feynman Flashcards",
-        "### Glossary",
-        "### Quick Quiz", 
-        "### Novel-Idea Meter",
-        "## How to Think Like"
-    ]
-    
-    # Count how many markers are present
-    marker_count = sum(1 for marker in gumloop_markers if marker in content)
-    
-    # If we have at least 4 markers, it's likely Gumloop content
-    return marker_count >= 4
+    # Gumloop output opens with its Video Context block (Title, Speakers,
+    # Synopsis), so only the head is searched; plain transcripts, which can
+    # run to megabytes, are never scanned in full
+    head = content[:_GUMLOOP_HEADER_SCAN_CHARS]
+    marker_count = 0
+    for marker in _GUMLOOP_MARKERS:
+        if marker in head:
+            marker_count += 1
+            # If we have at least 4 markers, it's likely Gumloop content
+            if marker_count >= 4:
+                return True
+    return False
 
 
 def parse_gumloop_summary(content: str) -> Optional[GumloopSummary]:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional, Tuple
 from gumloop import GumloopClient
@@ -26,6 +27,11 @@ class GumloopService:
         else:
             logger.warning("⚠️ Gumloop credentials not provided")
     
+    @property
+    def is_ready(self) -> bool:
+        """Whether the Gumloop client was created and can take requests"""
+        return self.client is not None
+    
     async def get_transcript(self, video_url: str) -> Optional[str]:
         """
         Extract transcript from YouTube video using Gumloop API
@@ -47,8 +53,10 @@ class GumloopService:
         try:
             logger.info(f"🔄 Attempting to get content via Gumloop for URL: {video_url}")
             
-            # Run the Gumloop flow with the video URL
-            output = self.client.run_flow(
+            # Run the Gumloop flow with the video URL; the client blocks while
+            # polling for the result, so run it off the event loop
+            output = await asyncio.to_thread(
+                self.client.run_flow,
                 flow_id=self.flow_id,
                 inputs={
                     "link": video_url
@@ -10,18 +10,35 @@ import json
 import asyncpg
 import asyncio
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 # TTL configuration (default 4 hours)
 PROGRESS_TTL_HOURS = int(os.getenv("PROGRESS_TTL_HOURS", "4"))
 
+# Hard cap on stored records so abandoned tasks can't grow the table unbounded
+PROGRESS_MAX_ROWS = int(os.getenv("PROGRESS_MAX_ROWS", "10000"))
+
 # Setup logging
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from logging_config import get_logger
 logger = get_logger(__name__)
 
+# Progress statuses and stages, interned once so every progress record shares
+# the same string objects instead of allocating new ones per write
+STATUS_QUEUED = sys.intern("queued")
+STATUS_PROCESSING = sys.intern("processing")
+STATUS_COMPLETED = sys.intern("completed")
+STATUS_ERROR = sys.intern("error")
+
+STAGE_QUEUED = sys.intern("Queued...")
+STAGE_INITIALIZING = sys.intern("Initializing...")
+STAGE_FETCHING = sys.intern("Fetching video data and transcript...")
+STAGE_ANALYZING = sys.intern("Analyzing content with AI...")
+STAGE_GENERATING = sys.intern("Generating your summary...")
+STAGE_READY = sys.intern("Summary ready!")
+
 def parse_database_url(url: str) -> Dict[str, Any]:
     """Parse DATABASE_URL into connection parameters for Neon."""
     parsed = urlparse(url)
@@ -184,16 +201,26 @@ class ProgressStorage:
             return result.split()[-1] != '0'  # Returns "DELETE n"
     
     async def cleanup_expired(self) -> int:
-        """Remove expired progress records. Returns count of deleted records."""
+        """Remove expired progress records and trim the oldest beyond PROGRESS_MAX_ROWS.
+        Returns count of deleted records."""
         if not self.pool:
             await self.init()
             
         async with self.pool.acquire() as conn:
-            result = await conn.execute('''
+            expired = await conn.execute('''
                 DELETE FROM progress 
                 WHERE expires_at <= NOW()
             ''')
-            return int(result.split()[-1])  # Extract count from "DELETE n"
+            overflow = await conn.execute('''
+                DELETE FROM progress 
+                WHERE task_id IN (
+                    SELECT task_id FROM progress 
+                    ORDER BY created_at DESC 
+                    OFFSET $1
+                )
+            ''', PROGRESS_MAX_ROWS)
+            # Extract counts from "DELETE n"
+            return int(expired.split()[-1]) + int(overflow.split()[-1])
     
     async def get_debug_info(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get raw progress record for debugging (includes metadata)."""
@@ -217,6 +244,12 @@ class ProgressStorage:
                 }
             return None
     
+    def get_pool_stats(self) -> Tuple[int, int]:
+        """Return (max pool size, connections in use); (0, 0) before init."""
+        if not self.pool:
+            return 0, 0
+        return self.pool.get_max_size(), self.pool.get_size() - self.pool.get_idle_size()
+    
     async def close(self):
         """Close the connection pool."""
         if self.pool:
@@ -0,0 +1,77 @@
+"""
+Shapes a generated Summary into the /api/summarize response body
+"""
+from typing import Any, Dict
+
+from models.responses import Summary, VideoInfo
+
+def to_api_dict(
+    summary: Summary,
+    video_info: VideoInfo,
+    *,
+    video_id: str,
+    url: str,
+    task_id: str,
+    is_gumloop: bool,
+) -> Dict[str, Any]:
+    """Build the response dict, resolving each optional summary attribute once"""
+    metadata = summary.metadata
+    enrichment = getattr(summary, 'insight_enrichment', None)
+    flashcards = summary.flashcards
+    quiz_questions = summary.quiz_questions
+    knowledge_cards = summary.knowledge_cards
+    upload_date = video_info.upload_date
+    source = "gumloop" if is_gumloop else "standard"
+    
+    return {
+        "video_id": video_id,
+        "video_url": url,
+        "video_title": video_info.title,
+        "channel_name": video_info.channel_name,
+        "channel_id": video_info.channel_id,
+        "duration": video_info.duration,
+        "thumbnail_url": video_info.thumbnail_url,
+        "summary": summary.content,
+        "key_points": summary.key_points,
+        "user_id": "test-user",
+        "task_id": task_id,
+        # Enhanced metadata from YouTubeMetadataService
+        "description": video_info.description,
+        "view_count": video_info.view_count,
+        "like_count": video_info.like_count,
+        "comment_count": video_info.comment_count,
+        "upload_date": upload_date.isoformat() if upload_date else None,
+        "is_gumloop": is_gumloop,
+        # Processing source metadata
+        "processing_source": source,
+        "processing_version": "v1.0",
+        "language": "en",
+        # === GUMLOOP RICH CONTENT ===
+        # Speakers and synopsis come from the summary metadata
+        "speakers": metadata.speakers if metadata else [],
+        "synopsis": metadata.synopsis if metadata else None,
+        # Rich structured sections
+        "key_moments": [{"timestamp": km.timestamp, "insight": km.insight} for km in summary.key_moments],
+        "frameworks": [{"name": f.name, "description": f.description} for f in getattr(summary, 'frameworks', [])],
+        "debunked_assumptions": getattr(summary, 'debunked_assumptions', []),
+        "in_practice": getattr(summary, 'in_practice', []),
+        "playbooks": [{"trigger": p.trigger, "action": p.action} for p in getattr(summary, 'playbooks', [])],
+        # Learning pack
+        "learning_pack": {
+            "flashcards": [{"q": card.question, "a": card.answer} for card in flashcards],
+            "quiz": [{"q": quiz.question, "a": quiz.answer} for quiz in quiz_questions],
+            "glossary": [{"term": card.q, "definition": card.a} for card in knowledge_cards],
+            "novel_ideas": []  # Will be populated from AI analysis
+        } if (flashcards or quiz_questions or knowledge_cards) else None,
+        # Enrichment data
+        "enrichment": {
+            "tools": getattr(summary, 'tools', []),
+            "sentiment": enrichment.sentiment if enrichment else 'neutral',
+            "risks": enrichment.risks_blockers_questions if enrichment else []
+        },
+        "metadata": {
+            "task_id": task_id,
+            "source": source,
+            "ai_version": "v1.0"
+        }
+    }
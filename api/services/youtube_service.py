@@ -1,6 +1,7 @@
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 from typing import Optional
+from functools import lru_cache
 import httpx
 import re
 import sys
@@ -21,7 +22,10 @@ logger = logging.getLogger(__name__)
 
 class YouTubeService:
     def __init__(self):
-        self.client = httpx.AsyncClient()
+        # One pooled client per service instance so connections are kept alive across requests
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
         
         # Initialize Gumloop service if credentials are available (PRIMARY)
         self.gumloop_service = None
@@ -79,6 +83,9 @@ class YouTubeService:
     async def get_transcript(self, video_id: str, language: str = "en") -> tuple[Optional[str], bool]:
         """Get transcript for a YouTube video using Gumloop
         
+        Both transcript sources use synchronous clients, which are offloaded to
+        worker threads so they don't block the event loop.
+        
         Returns:
             Tuple of (transcript, is_gumloop) where is_gumloop indicates if content is from Gumloop
         """
@@ -98,8 +105,9 @@ class YouTubeService:
         # Simple fallback: Basic YouTube transcript API (no complex retry chains)
         logger.info(f"🔄 Attempting simple YouTube transcript API for video {video_id}")
         try:
-            # Single attempt with YouTube transcript API
-            transcript_list = YouTubeTranscriptApi.get_transcript(
+            # Single attempt with YouTube transcript API (synchronous, so run in a thread)
+            transcript_list = await asyncio.to_thread(
+                YouTubeTranscriptApi.get_transcript,
                 video_id,
                 languages=[language, "en", "en-US"]  # Simple language fallback
             )
@@ -188,5 +196,21 @@ class YouTubeService:
         return text.strip()
     
     
+    async def aclose(self):
+        """Close the HTTP client and the metadata service's worker thread"""
+        await self.client.aclose()
+        self.metadata_service.executor.shutdown(wait=False)
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
\ No newline at end of file
+        await self.aclose()
+
+@lru_cache(maxsize=None)
+def get_youtube_service() -> YouTubeService:
+    """Shared YouTubeService instance, so every router reuses one set of clients"""
+    return YouTubeService()
+
+async def close_youtube_service():
+    """Close the shared YouTubeService if it was created"""
+    if get_youtube_service.cache_info().currsize:
+        await get_youtube_service().aclose()
+        get_youtube_service.cache_clear()
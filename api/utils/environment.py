@@ -0,0 +1,14 @@
+"""
+Deployment environment checks shared by the app and its routers.
+"""
+
+import os
+
+
+def is_development() -> bool:
+    """True when NODE_ENV or ENVIRONMENT is set to "development".
+
+    Read from the environment on each call, so callers should resolve it
+    once after the .env file has been loaded.
+    """
+    return os.getenv("NODE_ENV") == "development" or os.getenv("ENVIRONMENT") == "development"
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Structured logging test for extra fields the JSON encoder must stringify
+"""
+
+import io
+import json
+import logging
+import os
+import sys
+import uuid
+
+# Add parent directories to path
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.dirname(current_dir)
+api_dir = os.path.join(parent_dir, 'api')
+
+sys.path.insert(0, api_dir)
+
+from logging_config import DevelopmentFormatter, StructuredFormatter, get_logger
+
+def capture(formatter, **extra):
+    """Log one record with the given extra fields, returning the formatted output"""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+    logger = get_logger("tests.logging_config")
+    logger.logger.addHandler(handler)
+    logger.logger.setLevel(logging.INFO)
+    logger.logger.propagate = False
+    try:
+        logger.info("Status counts", **extra)
+    finally:
+        logger.logger.removeHandler(handler)
+    return stream.getvalue()
+
+def main():
+    print("🪵 Structured Logging Test")
+    print("=" * 40)
+    failures = 0
+    key = uuid.uuid4()
+
+    output = capture(StructuredFormatter(), status_codes={200: 5, 404: 1}, by_task={key: "done"})
+    try:
+        metadata = json.loads(output)["metadata"]
+        ok = metadata["status_codes"] == {"200": 5, "404": 1} and metadata["by_task"] == {str(key): "done"}
+    except (ValueError, KeyError) as e:
+        print(f"  ❌ StructuredFormatter output unusable: {e}")
+        ok = False
+    print(f"  {'✅' if ok else '❌'} StructuredFormatter stringifies int and UUID keys")
+    failures += not ok
+
+    output = capture(DevelopmentFormatter(), status_codes={200: 5, 404: 1})
+    ok = '"200": 5' in output
+    print(f"  {'✅' if ok else '❌'} DevelopmentFormatter stringifies int keys")
+    failures += not ok
+
+    return failures
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)